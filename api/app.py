@@ -0,0 +1,47 @@
+"""
+FastAPI application for the connection settings API.
+Mounts the connections router and applies app-wide middleware.
+"""
+import logging
+
+# uvloop drops per-request event-loop overhead substantially; opt in when the
+# wheel is available and fall back to stock asyncio otherwise. uvicorn picks
+# up httptools for HTTP parsing on its own once installed.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+
+from api.connection_api import router as connections_router
+
+logger = logging.getLogger("connection_app")
+
+app = FastAPI(
+    title="Monitoring Connection API",
+    description="REST API for managing exchange, bot, and server connection settings",
+)
+
+# Compress large JSON payloads (connection lists); level 5 trades a little
+# CPU for ~70% size reduction on JSON. Small responses are left alone.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# One app-wide catch-all instead of try/except boilerplate in every handler.
+# HTTPExceptions keep their FastAPI built-in handling; anything else becomes
+# a consistent 500 with the full traceback logged here.
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    logger.exception(f"Unhandled error on {request.method} {request.url.path}")
+    return ORJSONResponse(
+        {"detail": f"Internal server error: {exc}"},
+        status_code=500,
+    )
+
+app.include_router(connections_router)
+
+# Deployment note: run under gunicorn with uvicorn workers, one per core:
+#   gunicorn api.app:app -k uvicorn.workers.UvicornWorker -w $(nproc)
@@ -2,18 +2,27 @@
 Connection Settings API.
 Provides REST API endpoints for managing connection settings for exchanges, bots, and servers.
 """
+import asyncio
 import os
+import hashlib
+import hmac
 import logging
+import time
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
-from fastapi import FastAPI, HTTPException, Depends, Header, Body, Query, status, APIRouter
-from fastapi.responses import JSONResponse
-from datetime import datetime
+from fastapi import FastAPI, HTTPException, Depends, Header, Body, Query, status, APIRouter, Request, Response, BackgroundTasks
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from datetime import datetime, timezone
+
+import orjson
 
 from api.connection_models import (
     ExchangeConnectionBase, ExchangeConnectionCreate, ExchangeConnectionUpdate, ExchangeConnectionResponse,
     BotConnectionBase, BotConnectionCreate, BotConnectionUpdate, BotConnectionResponse,
     ServerConnectionBase, ServerConnectionCreate, ServerConnectionUpdate, ServerConnectionResponse,
-    ConnectionTestRequest, ConnectionTestResponse
+    ConnectionTestRequest, ConnectionTestResponse,
+    ExchangeRow, BotRow, ServerRow
 )
 from utils.connection_manager import ConnectionManager
 from utils.connection_tester import ConnectionTester
@@ -22,457 +31,380 @@ from utils.connection_tester import ConnectionTester
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("connection_api")
 
-# Create the router
-router = APIRouter(
-    prefix="/connections",
-    tags=["connections"],
-    responses={404: {"description": "Not found"}},
-)
-
-# Initialize managers
-connection_manager = ConnectionManager()
-connection_tester = ConnectionTester()
-
 # Auth key for API security
 API_KEY = os.environ.get("CONFIG_API_KEY", "change_me_in_production")
 
+# Digests of accepted keys, computed once at import so the hot auth path
+# is a single hash + set lookup instead of a plain string compare
+ACCEPTED_KEY_DIGESTS = {hashlib.sha256(API_KEY.encode()).digest()}
+
+@lru_cache(maxsize=4096)
+def _check_api_key(api_key: str) -> bool:
+    """Check an API key against the accepted digests (cached per key)."""
+    # Comparing fixed-length sha256 digests is constant time in the key
+    # and never trips compare_digest's ASCII-only restriction on str
+    # inputs (headers arrive latin-1 decoded, so raw keys may not be
+    # ASCII)
+    digest = hashlib.sha256(api_key.encode()).digest()
+    return any(hmac.compare_digest(digest, d) for d in ACCEPTED_KEY_DIGESTS)
+
 # Dependency for API key verification
 async def verify_api_key(api_key: str = Header(..., alias="X-API-Key")):
-    if api_key != API_KEY:
+    if not _check_api_key(api_key):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API Key"
         )
     return api_key
 
-# Exchange Connection Routes
-@router.get("/exchanges", response_model=List[ExchangeConnectionResponse])
-async def get_all_exchange_connections(api_key: str = Depends(verify_api_key)):
-    """Get all exchange connections"""
-    try:
-        connections = connection_manager.get_all_exchange_connections()
-        return connections
-    except Exception as e:
-        logger.error(f"Error retrieving exchange connections: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve exchange connections: {str(e)}")
-
-@router.post("/exchanges", response_model=ExchangeConnectionResponse, status_code=status.HTTP_201_CREATED)
-async def create_exchange_connection(
-    connection: ExchangeConnectionCreate,
-    api_key: str = Depends(verify_api_key)
-):
-    """Create a new exchange connection"""
-    try:
-        new_connection = connection_manager.create_exchange_connection(connection)
-        return ExchangeConnectionResponse(**new_connection.dict())
-    except Exception as e:
-        logger.error(f"Error creating exchange connection: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to create exchange connection: {str(e)}")
-
-@router.get("/exchanges/{connection_id}", response_model=ExchangeConnectionResponse)
-async def get_exchange_connection(
-    connection_id: str,
-    api_key: str = Depends(verify_api_key)
-):
-    """Get exchange connection by ID"""
-    connection = connection_manager.get_exchange_connection(connection_id)
-    if not connection:
-        raise HTTPException(status_code=404, detail="Exchange connection not found")
-    
-    return ExchangeConnectionResponse(**connection.dict())
+# Create the router
+router = APIRouter(
+    prefix="/connections",
+    tags=["connections"],
+    responses={404: {"description": "Not found"}},
+    default_response_class=ORJSONResponse,
+    # Solved once per request for every route instead of per-endpoint Depends
+    dependencies=[Depends(verify_api_key)],
+)
 
-@router.put("/exchanges/{connection_id}", response_model=ExchangeConnectionResponse)
-async def update_exchange_connection(
-    connection_id: str,
-    updates: ExchangeConnectionUpdate,
-    api_key: str = Depends(verify_api_key)
-):
-    """Update an exchange connection"""
-    try:
-        # Convert updates to dict, excluding None values
-        update_data = {k: v for k, v in updates.dict().items() if v is not None}
-        
-        # Update the connection
-        updated_connection = connection_manager.update_exchange_connection(connection_id, update_data)
-        if not updated_connection:
-            raise HTTPException(status_code=404, detail="Exchange connection not found")
-        
-        return ExchangeConnectionResponse(**updated_connection.dict())
-    except Exception as e:
-        logger.error(f"Error updating exchange connection: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to update exchange connection: {str(e)}")
-
-@router.delete("/exchanges/{connection_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_exchange_connection(
-    connection_id: str,
-    api_key: str = Depends(verify_api_key)
-):
-    """Delete an exchange connection"""
-    success = connection_manager.delete_exchange_connection(connection_id)
-    if not success:
-        raise HTTPException(status_code=404, detail="Exchange connection not found")
-    
-    return None
+# Shared manager/tester providers. Using lru_cache keeps a single instance
+# per process (built on first request, not at import) and lets tests override
+# them through FastAPI's dependency_overrides.
+@lru_cache
+def get_connection_manager() -> ConnectionManager:
+    return ConnectionManager()
 
-# Bot Connection Routes
-@router.get("/bots", response_model=List[BotConnectionResponse])
-async def get_all_bot_connections(api_key: str = Depends(verify_api_key)):
-    """Get all bot connections"""
-    try:
-        connections = connection_manager.get_all_bot_connections()
-        return connections
-    except Exception as e:
-        logger.error(f"Error retrieving bot connections: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve bot connections: {str(e)}")
-
-@router.post("/bots", response_model=BotConnectionResponse, status_code=status.HTTP_201_CREATED)
-async def create_bot_connection(
-    connection: BotConnectionCreate,
-    api_key: str = Depends(verify_api_key)
-):
-    """Create a new bot connection"""
-    try:
-        new_connection = connection_manager.create_bot_connection(connection)
-        return BotConnectionResponse(**new_connection.dict())
-    except Exception as e:
-        logger.error(f"Error creating bot connection: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to create bot connection: {str(e)}")
-
-@router.get("/bots/{connection_id}", response_model=BotConnectionResponse)
-async def get_bot_connection(
-    connection_id: str,
-    api_key: str = Depends(verify_api_key)
-):
-    """Get bot connection by ID"""
-    connection = connection_manager.get_bot_connection(connection_id)
-    if not connection:
-        raise HTTPException(status_code=404, detail="Bot connection not found")
-    
-    return BotConnectionResponse(**connection.dict())
+@lru_cache
+def get_connection_tester() -> ConnectionTester:
+    return ConnectionTester()
 
-@router.put("/bots/{connection_id}", response_model=BotConnectionResponse)
-async def update_bot_connection(
-    connection_id: str,
-    updates: BotConnectionUpdate,
-    api_key: str = Depends(verify_api_key)
-):
-    """Update a bot connection"""
-    try:
-        # Convert updates to dict, excluding None values
-        update_data = {k: v for k, v in updates.dict().items() if v is not None}
-        
-        # Update the connection
-        updated_connection = connection_manager.update_bot_connection(connection_id, update_data)
-        if not updated_connection:
-            raise HTTPException(status_code=404, detail="Bot connection not found")
-        
-        return BotConnectionResponse(**updated_connection.dict())
-    except Exception as e:
-        logger.error(f"Error updating bot connection: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to update bot connection: {str(e)}")
-
-@router.delete("/bots/{connection_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_bot_connection(
-    connection_id: str,
-    api_key: str = Depends(verify_api_key)
-):
-    """Delete a bot connection"""
-    success = connection_manager.delete_bot_connection(connection_id)
-    if not success:
-        raise HTTPException(status_code=404, detail="Bot connection not found")
-    
+# Small in-process TTL cache for the read-heavy list endpoints. Each entry
+# records the write version it was built from and is ignored once the
+# version moves on, so any local write — CRUD handler or the background
+# test-status update — invalidates it without the handlers cooperating.
+# The TTL only bounds staleness for writes made by other workers.
+LIST_CACHE_TTL = 15  # seconds
+
+_list_cache: Dict[str, Any] = {}
+
+def _list_cache_get(namespace: str, version: int):
+    entry = _list_cache.get(namespace)
+    if entry and entry[1] == version and time.monotonic() < entry[0]:
+        return entry[2]
     return None
 
-# Server Connection Routes
-@router.get("/servers", response_model=List[ServerConnectionResponse])
-async def get_all_server_connections(api_key: str = Depends(verify_api_key)):
-    """Get all server connections"""
-    try:
-        connections = connection_manager.get_all_server_connections()
+def _list_cache_set(namespace: str, version: int, value):
+    _list_cache[namespace] = (time.monotonic() + LIST_CACHE_TTL, version, value)
+
+# Generic CRUD route registration
+# ETags carry a per-process epoch alongside the write version: the
+# counter restarts at zero on boot and is per-worker, so on its own a
+# token cached by a client could collide with a different process's
+# counter and produce a false 304 over changed data
+_ETAG_EPOCH = f"{time.time_ns():x}.{os.getpid():x}"
+
+# The exchange/bot/server route sets are identical except for resource name
+# and model classes, so they are generated from a single table. This keeps one
+# code path to maintain and builds each handler/schema once at import.
+def _register_crud_routes(name, singular, create_model, update_model, response_model, row_model):
+    """Register list/create/get/update/delete routes for one resource type."""
+    label = singular.capitalize()
+    get_all_method = f"get_all_{singular}_connections"
+    iter_method = f"iter_{singular}_connections"
+    create_method = f"create_{singular}_connection"
+    get_method = f"get_{singular}_connection"
+    update_method = f"update_{singular}_connection"
+    delete_method = f"delete_{singular}_connection"
+
+    async def get_all_connections(
+        request: Request,
+        response: Response,
+        manager: ConnectionManager = Depends(get_connection_manager)
+    ):
+        # Weak ETag from the write version: idle polls short-circuit with
+        # a 304 before any serialization happens
+        version = manager.get_version(name)
+        etag = f'W/"{_ETAG_EPOCH}-{version}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED,
+                            headers={"ETag": etag})
+
+        # NDJSON streaming opt-in: one masked record per line, so large
+        # result sets never get materialized as a single JSON array
+        if "application/x-ndjson" in request.headers.get("accept", ""):
+            def stream():
+                # Slots dataclass rows: no Pydantic instance per record, and
+                # orjson serializes dataclasses natively
+                for conn in getattr(manager, iter_method)():
+                    yield orjson.dumps(row_model.from_db(conn)) + b"\n"
+            return StreamingResponse(stream(), headers={"ETag": etag},
+                                     media_type="application/x-ndjson")
+
+        connections = _list_cache_get(name, version)
+        if connections is None:
+            connections = getattr(manager, get_all_method)()
+            _list_cache_set(name, version, connections)
+        response.headers["ETag"] = etag
         return connections
-    except Exception as e:
-        logger.error(f"Error retrieving server connections: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve server connections: {str(e)}")
-
-@router.post("/servers", response_model=ServerConnectionResponse, status_code=status.HTTP_201_CREATED)
-async def create_server_connection(
-    connection: ServerConnectionCreate,
-    api_key: str = Depends(verify_api_key)
-):
-    """Create a new server connection"""
-    try:
-        new_connection = connection_manager.create_server_connection(connection)
-        return ServerConnectionResponse(**new_connection.dict())
-    except Exception as e:
-        logger.error(f"Error creating server connection: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to create server connection: {str(e)}")
-
-@router.get("/servers/{connection_id}", response_model=ServerConnectionResponse)
-async def get_server_connection(
-    connection_id: str,
-    api_key: str = Depends(verify_api_key)
-):
-    """Get server connection by ID"""
-    connection = connection_manager.get_server_connection(connection_id)
-    if not connection:
-        raise HTTPException(status_code=404, detail="Server connection not found")
-    
-    return ServerConnectionResponse(**connection.dict())
 
-@router.put("/servers/{connection_id}", response_model=ServerConnectionResponse)
-async def update_server_connection(
-    connection_id: str,
-    updates: ServerConnectionUpdate,
-    api_key: str = Depends(verify_api_key)
-):
-    """Update a server connection"""
-    try:
-        # Convert updates to dict, excluding None values
-        update_data = {k: v for k, v in updates.dict().items() if v is not None}
-        
+    async def create_connection(
+        connection: create_model,
+        manager: ConnectionManager = Depends(get_connection_manager)
+    ):
+        new_connection = getattr(manager, create_method)(connection)
+        # response_model validates/masks once on the way out
+        return new_connection
+
+    async def get_connection(
+        connection_id: str,
+        manager: ConnectionManager = Depends(get_connection_manager)
+    ):
+        connection = getattr(manager, get_method)(connection_id)
+        if not connection:
+            raise HTTPException(status_code=404, detail=f"{label} connection not found")
+
+        return connection
+
+    async def update_connection(
+        connection_id: str,
+        updates: update_model,
+        manager: ConnectionManager = Depends(get_connection_manager)
+    ):
+        # Only fields the client actually sent, with nulls dropped
+        update_data = updates.model_dump(exclude_unset=True, exclude_none=True)
+
         # Update the connection
-        updated_connection = connection_manager.update_server_connection(connection_id, update_data)
+        updated_connection = getattr(manager, update_method)(connection_id, update_data)
         if not updated_connection:
-            raise HTTPException(status_code=404, detail="Server connection not found")
-        
-        return ServerConnectionResponse(**updated_connection.dict())
-    except Exception as e:
-        logger.error(f"Error updating server connection: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to update server connection: {str(e)}")
-
-@router.delete("/servers/{connection_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_server_connection(
-    connection_id: str,
-    api_key: str = Depends(verify_api_key)
-):
-    """Delete a server connection"""
-    success = connection_manager.delete_server_connection(connection_id)
-    if not success:
-        raise HTTPException(status_code=404, detail="Server connection not found")
-    
-    return None
+            raise HTTPException(status_code=404, detail=f"{label} connection not found")
+
+        return updated_connection
+
+    async def delete_connection(
+        connection_id: str,
+        manager: ConnectionManager = Depends(get_connection_manager)
+    ):
+        success = getattr(manager, delete_method)(connection_id)
+        if not success:
+            raise HTTPException(status_code=404, detail=f"{label} connection not found")
+
+        return None
+
+    # Keep the original per-resource operation names in OpenAPI
+    get_all_connections.__name__ = get_all_method
+    get_all_connections.__doc__ = f"Get all {singular} connections"
+    create_connection.__name__ = create_method
+    create_connection.__doc__ = f"Create a new {singular} connection"
+    get_connection.__name__ = get_method
+    get_connection.__doc__ = f"Get {singular} connection by ID"
+    update_connection.__name__ = update_method
+    update_connection.__doc__ = f"Update a {singular} connection"
+    delete_connection.__name__ = delete_method
+    delete_connection.__doc__ = f"Delete a {singular} connection"
+
+    router.add_api_route(f"/{name}", get_all_connections, methods=["GET"],
+                         response_model=List[response_model])
+    router.add_api_route(f"/{name}", create_connection, methods=["POST"],
+                         response_model=response_model, status_code=status.HTTP_201_CREATED)
+    router.add_api_route(f"/{name}/{{connection_id}}", get_connection, methods=["GET"],
+                         response_model=response_model)
+    router.add_api_route(f"/{name}/{{connection_id}}", update_connection, methods=["PUT"],
+                         response_model=response_model)
+    router.add_api_route(f"/{name}/{{connection_id}}", delete_connection, methods=["DELETE"],
+                         status_code=status.HTTP_204_NO_CONTENT)
+
+
+CRUD_RESOURCES = [
+    ("exchanges", "exchange", ExchangeConnectionCreate, ExchangeConnectionUpdate, ExchangeConnectionResponse, ExchangeRow),
+    ("bots", "bot", BotConnectionCreate, BotConnectionUpdate, BotConnectionResponse, BotRow),
+    ("servers", "server", ServerConnectionCreate, ServerConnectionUpdate, ServerConnectionResponse, ServerRow),
+]
+
+for _resource in CRUD_RESOURCES:
+    _register_crud_routes(*_resource)
 
 # Connection Testing Routes
-@router.post("/test/exchange", response_model=ConnectionTestResponse)
-async def test_exchange_connection(
-    request: ConnectionTestRequest,
-    api_key: str = Depends(verify_api_key)
+
+# Required connectionData fields per test type, hoisted so each request does
+# a single frozenset comparison instead of rebuilding the field list
+EXCHANGE_TEST_REQUIRED = frozenset({"exchangeName", "apiKey", "secretKey"})
+BOT_TEST_REQUIRED = frozenset({"apiEndpoint"})
+SERVER_TEST_REQUIRED = frozenset({"hostname"})
+
+# Cap concurrent probes so a large batch cannot hammer downstream services
+BULK_TEST_CONCURRENCY = 32
+
+@router.post("/test/bulk", response_model=List[ConnectionTestResponse],
+             response_class=ORJSONResponse)
+async def test_connections_bulk(
+    requests: List[ConnectionTestRequest],
+    background_tasks: BackgroundTasks,
+    manager: ConnectionManager = Depends(get_connection_manager),
+    tester: ConnectionTester = Depends(get_connection_tester)
 ):
-    """Test an exchange connection"""
-    try:
-        # Check if connectionType is correct
-        if request.connectionType != "exchange":
-            raise HTTPException(
-                status_code=400, 
-                detail="Invalid connection type. Expected 'exchange'"
-            )
-        
-        # Test existing connection or one-time connection data
-        if request.connectionId:
-            # Get existing connection
-            connection = connection_manager.get_exchange_connection(request.connectionId)
-            if not connection:
-                raise HTTPException(status_code=404, detail="Exchange connection not found")
-            
-            # Test connection
-            success, message, details = connection_tester.test_exchange_connection(
-                connection.exchangeName,
-                connection.apiKey,
-                connection.secretKey,
-                connection.additionalParams
-            )
-            
-            # Update connection status
-            connection_manager.update_exchange_connection(
-                request.connectionId,
-                {
-                    "lastTested": datetime.now().isoformat(),
-                    "connectionStatus": success,
-                    "lastError": None if success else message
-                }
-            )
-        elif request.connectionData:
-            # Test one-time connection data
-            data = request.connectionData
-            
-            if not all(k in data for k in ["exchangeName", "apiKey", "secretKey"]):
-                raise HTTPException(
-                    status_code=400, 
-                    detail="Missing required connection data fields"
-                )
-            
-            # Test connection
-            success, message, details = connection_tester.test_exchange_connection(
-                data["exchangeName"],
-                data["apiKey"],
-                data["secretKey"],
-                data.get("additionalParams")
+    """Test a batch of connections concurrently"""
+    semaphore = asyncio.Semaphore(BULK_TEST_CONCURRENCY)
+
+    async def _dispatch(request: ConnectionTestRequest) -> ConnectionTestResponse:
+        async with semaphore:
+            return await test_connection(
+                request.connectionType, request, background_tasks, manager, tester
             )
+
+    results = await asyncio.gather(
+        *(_dispatch(request) for request in requests),
+        return_exceptions=True
+    )
+
+    # Convert per-item failures into error responses so one bad entry
+    # doesn't fail the whole batch
+    responses = []
+    for result in results:
+        if isinstance(result, HTTPException):
+            responses.append(ConnectionTestResponse(
+                success=False,
+                message=str(result.detail),
+                details={"status_code": result.status_code},
+                timestamp=datetime.now(timezone.utc).isoformat()
+            ))
+        elif isinstance(result, Exception):
+            logger.error(f"Error in bulk connection test: {result}")
+            responses.append(ConnectionTestResponse(
+                success=False,
+                message=f"Failed to test connection: {result}",
+                timestamp=datetime.now(timezone.utc).isoformat()
+            ))
         else:
-            raise HTTPException(
-                status_code=400, 
-                detail="Either connectionId or connectionData must be provided"
-            )
-        
-        # Return test results
-        return ConnectionTestResponse(
-            success=success,
-            message=message,
-            details=details,
-            timestamp=datetime.now().isoformat()
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error testing exchange connection: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to test exchange connection: {str(e)}")
-
-@router.post("/test/bot", response_model=ConnectionTestResponse)
-async def test_bot_connection(
+            responses.append(result)
+
+    return responses
+
+
+# Argument builders for the dispatch table below: one pair per connection
+# type, for stored connections and one-off connectionData payloads.
+def _exchange_conn_args(connection):
+    return (connection.exchangeName, connection.apiKey,
+            connection.secretKey, connection.additionalParams)
+
+def _exchange_data_args(data):
+    return (data["exchangeName"], data["apiKey"],
+            data["secretKey"], data.get("additionalParams"))
+
+def _bot_conn_args(connection):
+    return (connection.apiEndpoint, connection.apiToken,
+            connection.healthCheckEndpoint)
+
+def _bot_data_args(data):
+    return (data["apiEndpoint"], data.get("apiToken"),
+            data.get("healthCheckEndpoint", "/health"))
+
+def _server_conn_args(connection):
+    return (connection.hostname, connection.port,
+            connection.monitoringProtocol, connection.healthEndpoint,
+            connection.authToken, connection.sshKey)
+
+def _server_data_args(data):
+    return (data["hostname"], data.get("port"),
+            data.get("monitoringProtocol", "http"), data.get("healthEndpoint"),
+            data.get("authToken"), data.get("sshKey"))
+
+# Single dispatch table shared by /test/{connection_type}: the manager
+# getter/updater, tester method, required one-off fields, the message for a
+# missing-field error, and the argument builders.
+TEST_DISPATCH = {
+    "exchange": (
+        "get_exchange_connection", "update_exchange_connection",
+        "test_exchange_connection", EXCHANGE_TEST_REQUIRED,
+        "Missing required connection data fields",
+        _exchange_conn_args, _exchange_data_args, "Exchange",
+    ),
+    "bot": (
+        "get_bot_connection", "update_bot_connection",
+        "test_bot_connection", BOT_TEST_REQUIRED,
+        "Missing required connection data field: apiEndpoint",
+        _bot_conn_args, _bot_data_args, "Bot",
+    ),
+    "server": (
+        "get_server_connection", "update_server_connection",
+        "test_server_connection", SERVER_TEST_REQUIRED,
+        "Missing required connection data field: hostname",
+        _server_conn_args, _server_data_args, "Server",
+    ),
+}
+
+@router.post("/test/{connection_type}", response_model=ConnectionTestResponse,
+             response_class=ORJSONResponse)
+async def test_connection(
+    connection_type: str,
     request: ConnectionTestRequest,
-    api_key: str = Depends(verify_api_key)
+    background_tasks: BackgroundTasks,
+    manager: ConnectionManager = Depends(get_connection_manager),
+    tester: ConnectionTester = Depends(get_connection_tester)
 ):
-    """Test a bot connection"""
-    try:
-        # Check if connectionType is correct
-        if request.connectionType != "bot":
-            raise HTTPException(
-                status_code=400, 
-                detail="Invalid connection type. Expected 'bot'"
-            )
+    """Test an exchange, bot, or server connection"""
+    entry = TEST_DISPATCH.get(connection_type)
+    if entry is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid connection type: {connection_type}"
+        )
+    getter, updater, tester_method, required, missing_detail, conn_args, data_args, label = entry
+
+    # One timestamp per request, reused for the status update and response
+    now_iso = datetime.now(timezone.utc).isoformat()
+
+    # Check if connectionType is correct
+    if request.connectionType != connection_type:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Invalid connection type. Expected '{connection_type}'"
+        )
+    
+    # Test existing connection or one-time connection data
+    if request.connectionId:
+        # Get existing connection
+        connection = getattr(manager, getter)(request.connectionId)
+        if not connection:
+            raise HTTPException(status_code=404, detail=f"{label} connection not found")
         
-        # Test existing connection or one-time connection data
-        if request.connectionId:
-            # Get existing connection
-            connection = connection_manager.get_bot_connection(request.connectionId)
-            if not connection:
-                raise HTTPException(status_code=404, detail="Bot connection not found")
-            
-            # Test connection
-            success, message, details = connection_tester.test_bot_connection(
-                connection.apiEndpoint,
-                connection.apiToken,
-                connection.healthCheckEndpoint
-            )
-            
-            # Update connection status
-            connection_manager.update_bot_connection(
-                request.connectionId,
-                {
-                    "lastTested": datetime.now().isoformat(),
-                    "connectionStatus": success,
-                    "lastError": None if success else message
-                }
-            )
-        elif request.connectionData:
-            # Test one-time connection data
-            data = request.connectionData
-            
-            if "apiEndpoint" not in data:
-                raise HTTPException(
-                    status_code=400, 
-                    detail="Missing required connection data field: apiEndpoint"
-                )
-            
-            # Test connection
-            success, message, details = connection_tester.test_bot_connection(
-                data["apiEndpoint"],
-                data.get("apiToken"),
-                data.get("healthCheckEndpoint", "/health")
-            )
-        else:
-            raise HTTPException(
-                status_code=400, 
-                detail="Either connectionId or connectionData must be provided"
-            )
+        # Test connection
+        success, message, details = await run_in_threadpool(
+            getattr(tester, tester_method), *conn_args(connection)
+        )
         
-        # Return test results
-        return ConnectionTestResponse(
-            success=success,
-            message=message,
-            details=details,
-            timestamp=datetime.now().isoformat()
+        # Record the test result after the response is sent; the caller
+        # only needs the probe outcome, not the bookkeeping write
+        background_tasks.add_task(
+            getattr(manager, updater),
+            request.connectionId,
+            {
+                "lastTested": now_iso,
+                "connectionStatus": success,
+                "lastError": None if success else message
+            }
         )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error testing bot connection: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to test bot connection: {str(e)}")
-
-@router.post("/test/server", response_model=ConnectionTestResponse)
-async def test_server_connection(
-    request: ConnectionTestRequest,
-    api_key: str = Depends(verify_api_key)
-):
-    """Test a server connection"""
-    try:
-        # Check if connectionType is correct
-        if request.connectionType != "server":
-            raise HTTPException(
-                status_code=400, 
-                detail="Invalid connection type. Expected 'server'"
-            )
+    elif request.connectionData:
+        # Test one-time connection data
+        data = request.connectionData
         
-        # Test existing connection or one-time connection data
-        if request.connectionId:
-            # Get existing connection
-            connection = connection_manager.get_server_connection(request.connectionId)
-            if not connection:
-                raise HTTPException(status_code=404, detail="Server connection not found")
-            
-            # Test connection
-            success, message, details = connection_tester.test_server_connection(
-                connection.hostname,
-                connection.port,
-                connection.monitoringProtocol,
-                connection.healthEndpoint,
-                connection.authToken,
-                connection.sshKey
-            )
-            
-            # Update connection status
-            connection_manager.update_server_connection(
-                request.connectionId,
-                {
-                    "lastTested": datetime.now().isoformat(),
-                    "connectionStatus": success,
-                    "lastError": None if success else message
-                }
-            )
-        elif request.connectionData:
-            # Test one-time connection data
-            data = request.connectionData
-            
-            if "hostname" not in data:
-                raise HTTPException(
-                    status_code=400, 
-                    detail="Missing required connection data field: hostname"
-                )
-            
-            # Test connection
-            success, message, details = connection_tester.test_server_connection(
-                data["hostname"],
-                data.get("port"),
-                data.get("monitoringProtocol", "http"),
-                data.get("healthEndpoint"),
-                data.get("authToken"),
-                data.get("sshKey")
-            )
-        else:
-            raise HTTPException(
-                status_code=400, 
-                detail="Either connectionId or connectionData must be provided"
-            )
+        if not data.keys() >= required:
+            raise HTTPException(status_code=400, detail=missing_detail)
         
-        # Return test results
-        return ConnectionTestResponse(
-            success=success,
-            message=message,
-            details=details,
-            timestamp=datetime.now().isoformat()
+        # Test connection
+        success, message, details = await run_in_threadpool(
+            getattr(tester, tester_method), *data_args(data)
         )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error testing server connection: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to test server connection: {str(e)}")
+    else:
+        raise HTTPException(
+            status_code=400, 
+            detail="Either connectionId or connectionData must be provided"
+        )
+    
+    # Return test results
+    return ConnectionTestResponse(
+        success=success,
+        message=message,
+        details=details,
+        timestamp=now_iso
+    )
+
@@ -3,14 +3,25 @@ Models for connection settings management.
 Provides Pydantic models for exchange, bot and server connections 
 with validation and secure field handling.
 """
-from typing import Dict, Any, List, Optional, Union
-from pydantic import BaseModel, Field, validator, AnyHttpUrl, root_validator
+from typing import ClassVar, Dict, Any, List, Optional, Union
+from dataclasses import dataclass
+from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
 import re
 import os
+import json
 import base64
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from functools import lru_cache
+
+# Prefer the Rust-backed rfernet implementation when its wheel is installed;
+# it is several times faster on the small payloads (API keys, tokens) we
+# encrypt here. Fall back to pyca cryptography so deployments without the
+# Rust wheel keep working.
+try:
+    from rfernet import Fernet
+    _RUST_FERNET = True
+except ImportError:
+    from cryptography.fernet import Fernet
+    _RUST_FERNET = False
 
 # Generate or load encryption key
 def get_encryption_key():
@@ -19,49 +30,116 @@ def get_encryption_key():
     os.makedirs(os.path.dirname(key_file), exist_ok=True)
     
     if os.path.exists(key_file):
-        with open(key_file, "rb") as f:
-            return f.read()
+        # Raw os.read skips BufferedReader setup; the 44-byte key is read
+        # once per process on the startup path before anything else imports
+        fd = os.open(key_file, os.O_RDONLY)
+        try:
+            return os.read(fd, 128)
+        finally:
+            os.close(fd)
     else:
-        # Generate a new key
-        salt = os.urandom(16)
-        password = os.urandom(32)  # This is just a random value for key derivation
-        
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password))
+        # os.urandom already provides 256 bits of entropy, so the key is
+        # used directly. PBKDF2 stretching only belongs here if the input
+        # ever becomes a human passphrase.
+        key = base64.urlsafe_b64encode(os.urandom(32))
         
         # Save the key
         with open(key_file, "wb") as f:
             f.write(key)
         
-        # Save salt and password hash for potential recovery
-        with open(os.path.join("data", "secure", "connection_salt.bin"), "wb") as f:
-            f.write(salt)
-            
         return key
 
 # Initialize encryption
 ENCRYPTION_KEY = get_encryption_key()
-cipher = Fernet(ENCRYPTION_KEY)
+# rfernet takes the key as a str, cryptography as bytes
+cipher = Fernet(ENCRYPTION_KEY.decode() if _RUST_FERNET else ENCRYPTION_KEY)
+
+# The two backends disagree on token types as well: rfernet's encrypt
+# already returns the token as a str and its decrypt takes a str, while
+# pyca works in bytes on both sides. Normalize behind shims so the
+# call sites below stay backend-agnostic (tokens as str, plaintext as
+# bytes).
+if _RUST_FERNET:
+    def _fernet_encrypt(data: bytes) -> str:
+        return cipher.encrypt(data)
+
+    def _fernet_decrypt(token: str) -> bytes:
+        return cipher.decrypt(token)
+else:
+    def _fernet_encrypt(data: bytes) -> str:
+        return cipher.encrypt(data).decode()
+
+    def _fernet_decrypt(token: str) -> bytes:
+        return cipher.decrypt(token.encode())
+
+# Compiled once at import; validate_hostname runs for every server row so the
+# per-call re-cache lookup is worth avoiding. IPv4 inputs are matched with a
+# dedicated pattern first to skip the alternation backtrack.
+_IPV4_RE = re.compile(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$')
+_HOSTNAME_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9\-\.]+)?[a-zA-Z0-9]$')
 
 def encrypt_value(value: str) -> str:
     """Encrypt a sensitive value"""
     if not value:
         return ""
-    return cipher.encrypt(value.encode()).decode()
+    return _fernet_encrypt(value.encode())
+
+@lru_cache(maxsize=4096)
+def _decrypt_cached(encrypted_value: str) -> str:
+    """Decrypt one ciphertext; memoized since the same stored ciphertext is
+    decrypted repeatedly (startup load plus every list render)."""
+    try:
+        return _fernet_decrypt(encrypted_value).decode()
+    except:
+        return "[DECRYPTION_ERROR]"
 
 def decrypt_value(encrypted_value: str) -> str:
     """Decrypt a sensitive value"""
     if not encrypted_value:
         return ""
+    return _decrypt_cached(encrypted_value)
+
+# Let callers (e.g. the connection manager on updates) drop memoized plaintexts
+decrypt_value.cache_clear = _decrypt_cached.cache_clear
+
+def encrypt_fields(fields: Dict[str, str]) -> str:
+    """Encrypt several sensitive fields as a single blob.
+
+    One Fernet call instead of one per field, so multi-secret writes pay
+    the IV/HMAC/base64 framing cost once.
+    """
+    return _fernet_encrypt(json.dumps(fields).encode())
+
+def decrypt_fields(blob: str) -> Dict[str, str]:
+    """Decrypt a blob produced by encrypt_fields."""
     try:
-        return cipher.decrypt(encrypted_value.encode()).decode()
+        return json.loads(_fernet_decrypt(blob))
     except:
-        return "[DECRYPTION_ERROR]"
+        return {}
+
+# Shared mask table: slicing a precomputed run of '*' avoids allocating a
+# fresh string via '*' * n for every masked field on every response
+_MASK = '*' * 4096
+
+def mask_secret(v: Optional[str]) -> Optional[str]:
+    """Mask a secret for display, keeping the first/last 4 chars when long."""
+    if not v:
+        return v
+    n = len(v)
+    if n > 8:
+        return v[:4] + _MASK[:n - 8] + v[-4:]
+    return _MASK[:n]
+
+def mask_ssh_key(v: Optional[str]) -> Optional[str]:
+    """Mask an SSH key for display, keeping only the header/footer lines."""
+    if not v:
+        return v
+    s = v.strip()
+    i = s.find('\n')
+    j = s.rfind('\n')
+    if i != -1 and i != j:
+        return f"{s[:i]}\n{_MASK[:20]}\n{s[j + 1:]}"
+    return _MASK[:20]
 
 # Base models
 class ConnectionBase(BaseModel):
@@ -82,8 +160,8 @@ class ExchangeConnectionBase(ConnectionBase):
     secretKey: str = Field(..., description="Secret Key for the exchange")
     additionalParams: Optional[Dict[str, str]] = Field({}, description="Additional parameters")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Binance Main Account",
                 "description": "Main trading account on Binance",
@@ -96,6 +174,7 @@ class ExchangeConnectionBase(ConnectionBase):
                 "isActive": True
             }
         }
+    )
 
 class ExchangeConnectionCreate(ExchangeConnectionBase):
     """Model for creating a new exchange connection"""
@@ -119,25 +198,21 @@ class ExchangeConnectionInDB(ExchangeConnectionBase):
     additionalParams: Dict[str, str]
     
     # These fields will be encrypted when stored
-    _encrypted_fields = ["apiKey", "secretKey"]
-    
-    class Config:
-        orm_mode = True
+    _encrypted_fields: ClassVar[List[str]] = ["apiKey", "secretKey"]
+
+    model_config = ConfigDict(from_attributes=True)
 
 class ExchangeConnectionResponse(ExchangeConnectionBase):
     """Model for exchange connection API response with masked sensitive fields"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     apiKey: str = Field(..., description="Masked API Key")
     secretKey: str = Field(..., description="Masked Secret Key")
-    
-    @validator('apiKey', 'secretKey')
-    def mask_sensitive(cls, v):
-        """Mask sensitive values in response"""
-        if v and len(v) > 8:
-            return v[:4] + '*' * (len(v) - 8) + v[-4:]
-        elif v:
-            return '*' * len(v)
-        return ""
+
+    # Shared module-level masking keeps one implementation (and one schema
+    # node) across the three response classes
+    mask_sensitive = field_validator('apiKey', 'secretKey')(mask_secret)
 
 # Bot Connection models
 class BotConnectionBase(ConnectionBase):
@@ -148,8 +223,8 @@ class BotConnectionBase(ConnectionBase):
     healthCheckEndpoint: Optional[str] = Field("/health", description="Health check endpoint")
     telegramBotToken: Optional[str] = Field(None, description="Telegram bot token if applicable")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Trading Bot Alpha",
                 "description": "Main trading bot for strategy Alpha",
@@ -161,6 +236,7 @@ class BotConnectionBase(ConnectionBase):
                 "isActive": True
             }
         }
+    )
 
 class BotConnectionCreate(BotConnectionBase):
     """Model for creating a new bot connection"""
@@ -181,29 +257,22 @@ class BotConnectionInDB(BotConnectionBase):
     """Model for bot connection stored in database with encrypted fields"""
     id: str
     apiToken: str
-    telegramBotToken: Optional[str]
+    telegramBotToken: Optional[str] = None
     
     # These fields will be encrypted when stored
-    _encrypted_fields = ["apiToken", "telegramBotToken"]
-    
-    class Config:
-        orm_mode = True
+    _encrypted_fields: ClassVar[List[str]] = ["apiToken", "telegramBotToken"]
+
+    model_config = ConfigDict(from_attributes=True)
 
 class BotConnectionResponse(BotConnectionBase):
     """Model for bot connection API response with masked sensitive fields"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     apiToken: str = Field(..., description="Masked API Token")
     telegramBotToken: Optional[str] = Field(None, description="Masked Telegram Token")
-    
-    @validator('apiToken', 'telegramBotToken')
-    def mask_sensitive(cls, v):
-        """Mask sensitive values in response"""
-        if not v:
-            return v
-        if len(v) > 8:
-            return v[:4] + '*' * (len(v) - 8) + v[-4:]
-        else:
-            return '*' * len(v)
+
+    mask_sensitive = field_validator('apiToken', 'telegramBotToken')(mask_secret)
 
 # Server Connection models
 class ServerConnectionBase(ConnectionBase):
@@ -217,22 +286,27 @@ class ServerConnectionBase(ConnectionBase):
     sshKey: Optional[str] = Field(None, description="SSH key for SSH monitoring")
     checkInterval: int = Field(60, description="Interval in seconds between checks")
     
-    @validator('hostname')
+    @field_validator('hostname')
+    @classmethod
     def validate_hostname(cls, v):
         """Validate hostname format"""
-        if not re.match(r'^[a-zA-Z0-9]([a-zA-Z0-9\-\.]+)?[a-zA-Z0-9]$|^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$', v):
-            raise ValueError('Invalid hostname or IP address format')
-        return v
+        if v and v[0].isdigit():
+            if _IPV4_RE.match(v) or _HOSTNAME_RE.match(v):
+                return v
+        elif _HOSTNAME_RE.match(v):
+            return v
+        raise ValueError('Invalid hostname or IP address format')
     
-    @validator('port')
+    @field_validator('port')
+    @classmethod
     def validate_port(cls, v):
         """Validate port range"""
         if v is not None and (v < 1 or v > 65535):
             raise ValueError('Port must be between 1 and 65535')
         return v
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Production API Server",
                 "description": "Main production API server",
@@ -246,6 +320,7 @@ class ServerConnectionBase(ConnectionBase):
                 "isActive": True
             }
         }
+    )
 
 class ServerConnectionCreate(ServerConnectionBase):
     """Model for creating a new server connection"""
@@ -268,41 +343,25 @@ class ServerConnectionUpdate(BaseModel):
 class ServerConnectionInDB(ServerConnectionBase):
     """Model for server connection stored in database with encrypted fields"""
     id: str
-    authToken: Optional[str]
-    sshKey: Optional[str]
+    authToken: Optional[str] = None
+    sshKey: Optional[str] = None
     
     # These fields will be encrypted when stored
-    _encrypted_fields = ["authToken", "sshKey"]
-    
-    class Config:
-        orm_mode = True
+    _encrypted_fields: ClassVar[List[str]] = ["authToken", "sshKey"]
+
+    model_config = ConfigDict(from_attributes=True)
 
 class ServerConnectionResponse(ServerConnectionBase):
     """Model for server connection API response with masked sensitive fields"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     authToken: Optional[str] = Field(None, description="Masked Auth Token")
     sshKey: Optional[str] = Field(None, description="Masked SSH Key")
+
+    mask_auth_token = field_validator('authToken')(mask_secret)
     
-    @validator('authToken')
-    def mask_auth_token(cls, v):
-        """Mask auth token in response"""
-        if not v:
-            return v
-        if len(v) > 8:
-            return v[:4] + '*' * (len(v) - 8) + v[-4:]
-        else:
-            return '*' * len(v)
-    
-    @validator('sshKey')
-    def mask_ssh_key(cls, v):
-        """Mask SSH key in response"""
-        if not v:
-            return v
-        # Only show key format and first/last few characters
-        lines = v.strip().split("\n")
-        if len(lines) > 2:
-            return f"{lines[0]}\n{'*' * 20}\n{lines[-1]}"
-        return '*' * 20
+    mask_ssh = field_validator('sshKey')(mask_ssh_key)
 
 # Connection test models
 class ConnectionTestRequest(BaseModel):
@@ -311,16 +370,13 @@ class ConnectionTestRequest(BaseModel):
     connectionId: Optional[str] = Field(None, description="ID of existing connection to test")
     connectionData: Optional[Dict[str, Any]] = Field(None, description="Connection data for one-time test")
     
-    @root_validator
-    def check_required_fields(cls, values):
+    @model_validator(mode="after")
+    def check_required_fields(self):
         """Validate that either connectionId or connectionData is provided"""
-        conn_id = values.get('connectionId')
-        conn_data = values.get('connectionData')
-        
-        if not conn_id and not conn_data:
+        if not self.connectionId and not self.connectionData:
             raise ValueError('Either connectionId or connectionData must be provided')
-        
-        return values
+
+        return self
 
 class ConnectionTestResponse(BaseModel):
     """Response model for connection test results"""
@@ -328,3 +384,109 @@ class ConnectionTestResponse(BaseModel):
     message: str = Field(..., description="Test result message")
     details: Optional[Dict[str, Any]] = Field(None, description="Additional details about the test")
     timestamp: str = Field(..., description="Timestamp of the test")
+
+
+# Lightweight row types for the read-heavy list/stream path. A slots
+# dataclass carries no __dict__ or __fields_set__, so emitting thousands of
+# rows allocates a fraction of the memory of a Response model instance, and
+# orjson serializes dataclasses natively. The Pydantic Response classes stay
+# authoritative for OpenAPI and single-object endpoints.
+@dataclass(slots=True)
+class ExchangeRow:
+    id: str
+    name: str
+    description: Optional[str]
+    isActive: bool
+    lastTested: Optional[str]
+    connectionStatus: Optional[bool]
+    lastError: Optional[str]
+    exchangeName: str
+    apiKey: str
+    secretKey: str
+    additionalParams: Dict[str, str]
+
+    @classmethod
+    def from_db(cls, conn: "ExchangeConnectionInDB") -> "ExchangeRow":
+        return cls(
+            id=conn.id,
+            name=conn.name,
+            description=conn.description,
+            isActive=conn.isActive,
+            lastTested=conn.lastTested,
+            connectionStatus=conn.connectionStatus,
+            lastError=conn.lastError,
+            exchangeName=conn.exchangeName,
+            apiKey=mask_secret(conn.apiKey),
+            secretKey=mask_secret(conn.secretKey),
+            additionalParams=conn.additionalParams,
+        )
+
+@dataclass(slots=True)
+class BotRow:
+    id: str
+    name: str
+    description: Optional[str]
+    isActive: bool
+    lastTested: Optional[str]
+    connectionStatus: Optional[bool]
+    lastError: Optional[str]
+    botType: str
+    apiEndpoint: str
+    apiToken: str
+    healthCheckEndpoint: Optional[str]
+    telegramBotToken: Optional[str]
+
+    @classmethod
+    def from_db(cls, conn: "BotConnectionInDB") -> "BotRow":
+        return cls(
+            id=conn.id,
+            name=conn.name,
+            description=conn.description,
+            isActive=conn.isActive,
+            lastTested=conn.lastTested,
+            connectionStatus=conn.connectionStatus,
+            lastError=conn.lastError,
+            botType=conn.botType,
+            apiEndpoint=conn.apiEndpoint,
+            apiToken=mask_secret(conn.apiToken),
+            healthCheckEndpoint=conn.healthCheckEndpoint,
+            telegramBotToken=mask_secret(conn.telegramBotToken),
+        )
+
+@dataclass(slots=True)
+class ServerRow:
+    id: str
+    name: str
+    description: Optional[str]
+    isActive: bool
+    lastTested: Optional[str]
+    connectionStatus: Optional[bool]
+    lastError: Optional[str]
+    serverType: str
+    hostname: str
+    port: Optional[int]
+    monitoringProtocol: str
+    healthEndpoint: Optional[str]
+    authToken: Optional[str]
+    sshKey: Optional[str]
+    checkInterval: int
+
+    @classmethod
+    def from_db(cls, conn: "ServerConnectionInDB") -> "ServerRow":
+        return cls(
+            id=conn.id,
+            name=conn.name,
+            description=conn.description,
+            isActive=conn.isActive,
+            lastTested=conn.lastTested,
+            connectionStatus=conn.connectionStatus,
+            lastError=conn.lastError,
+            serverType=conn.serverType,
+            hostname=conn.hostname,
+            port=conn.port,
+            monitoringProtocol=conn.monitoringProtocol,
+            healthEndpoint=conn.healthEndpoint,
+            authToken=mask_secret(conn.authToken),
+            sshKey=mask_ssh_key(conn.sshKey),
+            checkInterval=conn.checkInterval,
+        )
@@ -9,27 +9,18 @@ import time
 import schedule
 import threading
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
-from monitoring.health_check import run_health_checks
-from monitoring.exception_tracker import setup_exception_tracking
-from monitoring.performance import check_system_performance
-from monitoring.api_validator import run_api_validations
-from monitoring.database_monitor import run_database_checks
-from monitoring.bot_monitor import run_bot_monitoring
-from monitoring.log_monitor import LogMonitoringManager, run_log_forwarding
-from monitoring.uptime_monitor import run_uptime_checks
-from monitoring.remote_access import check_remote_access_tools
-from monitoring.exchange_api_monitor import run_exchange_api_checks, test_webhooks
-from monitoring.database_monitor import run_database_checks
-from monitoring.anomaly_detection import check_system_anomalies, check_api_anomalies
-from monitoring.dynamic_monitor import run_dynamic_monitoring
 from utils.dynamic_config_manager import DynamicConfigManager
-from api.config_manager_api import app as config_api_app
 from utils.config import Config
 from utils.notification import TelegramNotifier
 
+# The monitoring submodules are imported inside start_monitoring /
+# start_api_server: each pulls heavy transitive dependencies (requests,
+# psutil, numpy, ...) that are only needed once its job actually runs.
+
 # Setup logging
 os.makedirs("logs", exist_ok=True)
 logging.basicConfig(
@@ -43,29 +34,60 @@ logging.basicConfig(
 logger = logging.getLogger("monitoring_service")
 
 # Load environment variables
-load_dotenv()
+env_path = Path('.') / '.env'
+load_dotenv(dotenv_path=env_path)
 
 # Initialize configuration manager
 config_manager = DynamicConfigManager()
-env_path = Path('.') / '.env'
-load_dotenv(dotenv_path=env_path)
 
 # Initialize config
 config = Config()
 notifier = TelegramNotifier(config.telegram_bot_token, config.telegram_chat_id)
 
 
+# Scheduled jobs are submitted to this pool so I/O-bound checks overlap
+# instead of serializing inside schedule.run_pending(). Each job keeps a
+# lock so a slow run can never overlap the next tick of the same job.
+_job_pool = ThreadPoolExecutor(max_workers=8)
+
+def _submit(fn, **kwargs):
+    """Wrap a job so the scheduler only enqueues it to the worker pool."""
+    lock = threading.Lock()
+
+    def job():
+        if not lock.acquire(blocking=False):
+            logger.warning(f"Skipping {fn.__name__}: previous run still in progress")
+            return
+        def run():
+            try:
+                fn(**kwargs)
+            finally:
+                lock.release()
+        _job_pool.submit(run)
+
+    job.__name__ = fn.__name__
+    return job
+
 def run_scheduled_job():
     """Run all monitoring jobs according to schedule"""
+    # Sleep until the next job is due instead of polling every second; the
+    # 60s cap keeps the loop responsive to jobs registered after startup
     while True:
+        idle = schedule.idle_seconds()
+        if idle is None:
+            time.sleep(60)
+            continue
+        if idle > 0:
+            time.sleep(min(idle, 60))
         schedule.run_pending()
-        time.sleep(1)
 
 
 def start_api_server(host="0.0.0.0", port=8000):
     """Start the API server for configuration management in a separate thread."""
     import uvicorn
     
+    from api.config_manager_api import app as config_api_app
+    
     class Server(uvicorn.Server):
         def install_signal_handlers(self):
             # Override to prevent API server from capturing signals
@@ -85,68 +107,65 @@ def start_monitoring():
     """Setup and start all monitoring services"""
     logger.info("Starting monitoring services")
     
+    from monitoring.health_check import run_health_checks
+    from monitoring.exception_tracker import setup_exception_tracking
+    from monitoring.performance import check_system_performance
+    from monitoring.api_validator import run_api_validations
+    from monitoring.database_monitor import run_database_checks
+    from monitoring.bot_monitor import run_bot_monitoring
+    from monitoring.log_monitor import LogMonitoringManager, run_log_forwarding
+    from monitoring.uptime_monitor import run_uptime_checks
+    from monitoring.remote_access import check_remote_access_tools
+    from monitoring.exchange_api_monitor import run_exchange_api_checks, test_webhooks
+    from monitoring.anomaly_detection import check_system_anomalies, check_api_anomalies
+    
     # Setup global exception tracking
     setup_exception_tracking(notifier)
     
     # Initialize log monitoring
     log_manager = LogMonitoringManager(config)
     schedule.every(config.log_check_interval).seconds.do(
-        run_log_forwarding,
-        log_manager=log_manager,
-        config=config,
-        notifier=notifier
+        _submit(run_log_forwarding, log_manager=log_manager,
+                config=config, notifier=notifier)
     )
     
     # Schedule uptime checks
     schedule.every(config.uptime_check_interval).seconds.do(
-        run_uptime_checks,
-        config=config,
-        notifier=notifier
+        _submit(run_uptime_checks, config=config, notifier=notifier)
     )
     
     # Schedule remote access tools monitoring
     schedule.every(config.remote_access_check_interval).seconds.do(
-        check_remote_access_tools,
-        config=config,
-        notifier=notifier
+        _submit(check_remote_access_tools, config=config, notifier=notifier)
     )
     
     # Schedule exchange API monitoring
     schedule.every(config.exchange_api_check_interval).seconds.do(
-        run_exchange_api_checks,
-        config=config,
-        notifier=notifier
+        _submit(run_exchange_api_checks, config=config, notifier=notifier)
     )
     
     # Schedule webhook testing (less frequent)
     schedule.every(config.webhook_test_interval).seconds.do(
-        test_webhooks,
-        config=config,
-        notifier=notifier
+        _submit(test_webhooks, config=config, notifier=notifier)
     )
     
     # Schedule database monitoring
     schedule.every(config.database_check_interval).seconds.do(
-        run_database_checks,
-        config=config,
-        notifier=notifier
+        _submit(run_database_checks, config=config, notifier=notifier)
     )
     
     # Schedule anomaly detection (less frequent)
     schedule.every(config.anomaly_detection_interval).seconds.do(
-        check_system_anomalies,
-        config=config,
-        notifier=notifier
+        _submit(check_system_anomalies, config=config, notifier=notifier)
     )
     schedule.every(config.anomaly_detection_interval * 2).seconds.do(
-        check_api_anomalies,
-        config=config,
-        notifier=notifier
+        _submit(check_api_anomalies, config=config, notifier=notifier)
     )
     
     # Start dynamic target monitoring if enabled
     if config.enable_dynamic_monitoring:
         try:
+            from monitoring.dynamic_monitor import run_dynamic_monitoring
             dynamic_monitor = run_dynamic_monitoring(config, notifier)
             logger.info("Dynamic target monitoring started")
         except Exception as e:
@@ -155,44 +174,27 @@ def start_monitoring():
     
     # Schedule basic health checks
     schedule.every(config.check_interval).seconds.do(
-        run_health_checks, 
-        config=config,
-        notifier=notifier
+        _submit(run_health_checks, config=config, notifier=notifier)
     )
     
     # Schedule performance monitoring
     schedule.every(config.check_interval).seconds.do(
-        check_system_performance, 
-        config=config,
-        notifier=notifier
+        _submit(check_system_performance, config=config, notifier=notifier)
     )
     
     # Schedule comprehensive API validations (less frequent)
     schedule.every(config.api_validation_interval).seconds.do(
-        run_api_validations,
-        config=config,
-        notifier=notifier
-    )
-    
-    # Schedule database monitoring
-    schedule.every(config.database_check_interval).seconds.do(
-        run_database_checks,
-        config=config,
-        notifier=notifier
+        _submit(run_api_validations, config=config, notifier=notifier)
     )
     
     # Schedule bot process monitoring
     schedule.every(config.bot_check_interval).seconds.do(
-        run_bot_monitoring,
-        config=config,
-        notifier=notifier
+        _submit(run_bot_monitoring, config=config, notifier=notifier)
     )
     
     # Daily system status report
     schedule.every().day.at("08:00").do(
-        send_daily_report,
-        config=config,
-        notifier=notifier
+        _submit(send_daily_report, config=config, notifier=notifier)
     )
     
     # Start the scheduling thread
@@ -223,16 +225,14 @@ def send_daily_report(config, notifier):
     # Get current metrics
     metrics = get_system_metrics()
     
-    # Generate report
-    status_summary = []
-    all_ok = True
-    
-    for service_name, info in service_status.items():
-        if info["last_status"] != "ok":
-            status_summary.append(f"❌ {service_name}: {info['failures']} consecutive failures")
-            all_ok = False
-        else:
-            status_summary.append(f"✅ {service_name}: OK")
+    # Generate report: one C-level pass for the health verdict, one
+    # comprehension for the lines, instead of a Python loop with appends
+    all_ok = all(info["last_status"] == "ok" for info in service_status.values())
+    status_summary = [
+        f"✅ {name}: OK" if info["last_status"] == "ok"
+        else f"❌ {name}: {info['failures']} consecutive failures"
+        for name, info in service_status.items()
+    ]
     
     # Format report
     if all_ok:
@@ -0,0 +1,55 @@
+"""
+Optional Numba-compiled kernels for anomaly detection.
+
+When numba is installed the kernel below is JIT-compiled (cached across
+processes), lifting NumPy dispatch overhead and letting LLVM vectorize the
+loops. Without numba the same function runs as plain Python/NumPy, so the
+detector works either way; callers can branch on HAS_NUMBA when a pure
+NumPy expression would beat the uncompiled loop.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def trend_kernel(y):
+    """Closed-form degree-1 fit over x = arange(len(y)).
+
+    Returns (slope, intercept, r_squared) from a single fused sweep.
+    """
+    w = y.size
+    x_mean = (w - 1) / 2.0
+    x_var = (w * w - 1) / 12.0
+
+    y_mean = 0.0
+    for i in range(w):
+        y_mean += y[i]
+    y_mean /= w
+
+    cov = 0.0
+    ss_tot = 0.0
+    for i in range(w):
+        dy = y[i] - y_mean
+        cov += (i - x_mean) * dy
+        ss_tot += dy * dy
+
+    slope = cov / (w * x_var)
+    intercept = y_mean - slope * x_mean
+
+    ss_res = 0.0
+    for i in range(w):
+        resid = (y[i] - y_mean) - slope * (i - x_mean)
+        ss_res += resid * resid
+
+    r_squared = 1.0 - ss_res / ss_tot if ss_tot > 0.0 else 0.0
+    return slope, intercept, r_squared
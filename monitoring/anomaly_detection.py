@@ -7,12 +7,193 @@ import logging
 import numpy as np
 import json
 import os
+import re
+import sys
+
+# orjson (de)serializes metric blobs several times faster than stdlib
+# json and returns bytes directly, so persisted payloads skip a str
+# encode; OPT_SERIALIZE_NUMPY also accepts NumPy scalars natively
+try:
+    import orjson
+
+    def _json_loads(buf):
+        return orjson.loads(buf)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    orjson = None
+
+    def _json_loads(buf):
+        return json.loads(buf)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+import queue
+import threading
+from bisect import insort, bisect_left
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple, Union
 import time
 
+from monitoring._anomaly_numba import HAS_NUMBA, trend_kernel
+
 logger = logging.getLogger("monitoring.anomaly_detection")
 
+# Points kept per metric series
+SERIES_CAPACITY = 1000
+
+# Recompute the running sums from scratch this often to bound float drift
+STATS_REBUILD_INTERVAL = 4096
+
+# Memory-mapped binary ring files, one set per series; a push is a
+# pointer store into the page cache and restart costs zero parsing
+METRICS_DIR = "data/metrics"
+
+# Append-only anomaly log: one buffered file instead of a file per event
+ANOMALY_LOG_PATH = "data/anomalies.ndjson"
+ANOMALY_LOG_MAX_BYTES = 50 * 1024 * 1024
+ANOMALY_FLUSH_EVERY = 16
+
+
+def _iso_to_ns(ts: str) -> int:
+    """Parse an ISO-8601 timestamp to integer epoch nanoseconds."""
+    return int(datetime.fromisoformat(ts).timestamp() * 1e9)
+
+
+def _ns_to_iso(ns: int) -> str:
+    """Format epoch nanoseconds back to the ISO form callers expect."""
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
+
+@dataclass
+class _Series:
+    """Preallocated ring buffer for one metric series.
+
+    Values and timestamps live in two parallel NumPy arrays (SoA layout),
+    so detection reads a contiguous float64 view instead of rebuilding an
+    array from a list of per-point dicts on every call.
+    """
+    values: np.ndarray = field(
+        default_factory=lambda: np.empty(SERIES_CAPACITY, dtype=np.float64))
+    timestamps: np.ndarray = field(
+        default_factory=lambda: np.empty(SERIES_CAPACITY, dtype=np.int64))
+    head: int = 0
+    size: int = 0
+    # Running statistics maintained incrementally by push(): O(1) mean/std
+    # and an order-maintained copy of the window for O(log N) quartiles
+    total: float = 0.0
+    total_sq: float = 0.0
+    sorted_values: List[float] = field(default_factory=list)
+    _pushes: int = 0
+    # Memoized analyze() verdict, valid until the next push
+    dirty: bool = True
+    last_result: Optional[Dict[str, Any]] = None
+    last_result_key: Optional[Tuple] = None
+    # head/size mirror for memmap-backed series, persisted with the data
+    meta: Optional[np.ndarray] = None
+
+    def push(self, value: float, ts: int):
+        """Append one sample, evicting the oldest once full."""
+        if self.size == SERIES_CAPACITY:
+            old = float(self.values[self.head])
+            self.total -= old
+            self.total_sq -= old * old
+            del self.sorted_values[bisect_left(self.sorted_values, old)]
+        self.values[self.head] = value
+        self.timestamps[self.head] = ts
+        self.head = (self.head + 1) % SERIES_CAPACITY
+        if self.size < SERIES_CAPACITY:
+            self.size += 1
+        if self.meta is not None:
+            self.meta[0] = self.head
+            self.meta[1] = self.size
+        self.total += value
+        self.total_sq += value * value
+        insort(self.sorted_values, value)
+        self.dirty = True
+        self._pushes += 1
+        if self._pushes >= STATS_REBUILD_INTERVAL:
+            self._rebuild_stats()
+
+    def _rebuild_stats(self):
+        """Recompute the running sums exactly to cancel accumulated drift."""
+        window = self.view()
+        self.total = float(window.sum())
+        self.total_sq = float(np.dot(window, window))
+        self._pushes = 0
+
+    def mean_std(self) -> Tuple[float, float]:
+        """O(1) mean and population std from the running sums."""
+        mean = self.total / self.size
+        var = self.total_sq / self.size - mean * mean
+        return mean, np.sqrt(var) if var > 0 else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Quantile with np.percentile's linear interpolation, O(1) lookup."""
+        pos = (self.size - 1) * q
+        lo = int(pos)
+        frac = pos - lo
+        if frac == 0.0 or lo + 1 >= self.size:
+            return self.sorted_values[lo]
+        return self.sorted_values[lo] + frac * (self.sorted_values[lo + 1] - self.sorted_values[lo])
+
+    def view(self) -> np.ndarray:
+        """Values in chronological order; zero-copy until the ring wraps."""
+        if self.size < SERIES_CAPACITY:
+            return self.values[:self.size]
+        return np.concatenate((self.values[self.head:], self.values[:self.head]))
+
+    def timestamps_view(self) -> np.ndarray:
+        """Timestamps in chronological order, matching view()."""
+        if self.size < SERIES_CAPACITY:
+            return self.timestamps[:self.size]
+        return np.concatenate((self.timestamps[self.head:], self.timestamps[:self.head]))
+
+    def latest(self) -> Tuple[float, str]:
+        """The most recently pushed (value, ISO timestamp) pair."""
+        idx = (self.head - 1) % SERIES_CAPACITY
+        return float(self.values[idx]), _ns_to_iso(int(self.timestamps[idx]))
+
+def _series_stem(category: str, name: str) -> str:
+    """Filesystem stem for one series' ring files."""
+    safe_cat = re.sub(r"[^A-Za-z0-9._-]", "_", category)
+    safe_name = re.sub(r"[^A-Za-z0-9._-]", "_", name)
+    return os.path.join(METRICS_DIR, f"{safe_cat}@{safe_name}")
+
+
+def _open_series(stem: str) -> _Series:
+    """
+    Open (creating if needed) the memmap-backed ring files for one series.
+
+    Three files per series: <stem>.f64 (values), <stem>.i64 (timestamps)
+    and <stem>.meta (head, size). Existing data is re-attached without
+    any parsing; only the running statistics are rebuilt from the window.
+    """
+    layout = ((stem + ".f64", np.float64, SERIES_CAPACITY),
+              (stem + ".i64", np.int64, SERIES_CAPACITY),
+              (stem + ".meta", np.int64, 2))
+    fresh = not os.path.exists(layout[2][0])
+    for path, dtype, count in layout:
+        if not os.path.exists(path):
+            np.zeros(count, dtype=dtype).tofile(path)
+    series = _Series(
+        values=np.memmap(layout[0][0], dtype=np.float64, mode="r+",
+                         shape=(SERIES_CAPACITY,)),
+        timestamps=np.memmap(layout[1][0], dtype=np.int64, mode="r+",
+                             shape=(SERIES_CAPACITY,)),
+        meta=np.memmap(layout[2][0], dtype=np.int64, mode="r+", shape=(2,)),
+    )
+    if not fresh:
+        series.head = int(series.meta[0])
+        series.size = int(series.meta[1])
+        if series.size:
+            series._rebuild_stats()
+            series.sorted_values = sorted(series.view().tolist())
+    return series
+
+
 class AnomalyDetector:
     """Detect anomalies in monitoring metrics using statistical methods."""
     
@@ -24,30 +205,98 @@ class AnomalyDetector:
             config: Application configuration
         """
         self.config = config
-        self.metrics_history = {}
+        # category -> name -> _Series ring buffer
+        # Flat (category, name)-keyed map: one interned-tuple lookup per
+        # access instead of hashing two strings through nested dicts
+        self.metrics_history: Dict[Tuple[str, str], _Series] = {}
         self.anomalies_detected = {}
         
         # Create data directory
         os.makedirs("data/anomalies", exist_ok=True)
         
+        # Cached x-axis arrays for trend fitting, keyed by window size
+        self._trend_x: Dict[int, np.ndarray] = {}
+        
         # Load historical data if available
         self._load_metrics_history()
+        
+        # Detected anomalies append to one buffered NDJSON log rather than
+        # creating a fresh file (open/dump/close + new inode) per event
+        self._anom_fh = open(ANOMALY_LOG_PATH, "ab", buffering=1 << 16)
+        self._anom_writes = 0
+        
+        # Saves run on a background thread: add_metric only drops a signal
+        # in the queue, and the writer coalesces pending signals into one
+        # atomic tmp-file + os.replace writeback
+        self._save_q: queue.Queue = queue.Queue()
+        self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+        self._save_thread.start()
+        self._adds_since_save = 0
     
+    def _series(self, category: str, name: str) -> _Series:
+        """The (possibly new) memmap-backed series for one metric."""
+        key = (sys.intern(category), sys.intern(name))
+        series = self.metrics_history.get(key)
+        if series is None:
+            series = self.metrics_history[key] = _open_series(
+                _series_stem(category, name))
+        return series
+
     def _load_metrics_history(self):
-        """Load metrics history from disk if available."""
+        """Re-attach persisted series and import any legacy JSON history."""
         try:
+            os.makedirs(METRICS_DIR, exist_ok=True)
+            for entry in os.scandir(METRICS_DIR):
+                if not entry.name.endswith(".meta"):
+                    continue
+                category, sep, name = entry.name[:-5].partition("@")
+                if sep:
+                    self._series(category, name)
+            
+            # One-time import of the old JSON history into the ring files
             if os.path.exists("data/metrics_history.json"):
-                with open("data/metrics_history.json", "r") as f:
-                    self.metrics_history = json.load(f)
+                with open("data/metrics_history.json", "rb") as f:
+                    raw = _json_loads(f.read())
+                for category, metrics in raw.items():
+                    for name, points in metrics.items():
+                        series = self._series(category, name)
+                        for point in points[-SERIES_CAPACITY:]:
+                            series.push(point["value"], _iso_to_ns(point["timestamp"]))
+                os.replace("data/metrics_history.json",
+                           "data/metrics_history.json.imported")
+            if self.metrics_history:
                 logger.info("Loaded metrics history from disk")
         except Exception as e:
             logger.error(f"Failed to load metrics history: {e}")
     
+    def _save_worker(self):
+        """Drain save signals and write the history atomically."""
+        while True:
+            try:
+                self._save_q.get(timeout=2)
+            except queue.Empty:
+                continue
+            # Coalesce any further pending requests into this write
+            while not self._save_q.empty():
+                try:
+                    self._save_q.get_nowait()
+                except queue.Empty:
+                    break
+            self._save_metrics_history()
+
+    def _request_save(self):
+        """Queue a save without blocking the metrics path."""
+        if self._save_q.qsize() < 2:
+            self._save_q.put_nowait(None)
+
     def _save_metrics_history(self):
-        """Save metrics history to disk."""
+        """Flush the memmapped rings so the page cache reaches disk."""
         try:
-            with open("data/metrics_history.json", "w") as f:
-                json.dump(self.metrics_history, f)
+            for series in self.metrics_history.values():
+                series.values.flush()
+                series.timestamps.flush()
+                if series.meta is not None:
+                    series.meta.flush()
         except Exception as e:
             logger.error(f"Failed to save metrics history: {e}")
     
@@ -61,31 +310,152 @@ class AnomalyDetector:
             category: Metric category (e.g., 'api', 'performance', 'system')
             timestamp: Optional timestamp (ISO format)
         """
-        if timestamp is None:
-            timestamp = datetime.now().isoformat()
+        # Store the timestamp as epoch nanoseconds: one integer write per
+        # sample instead of an ISO string allocation, formatted only when a
+        # result or the history file is built
+        ts_ns = time.time_ns() if timestamp is None else _iso_to_ns(timestamp)
         
-        # Initialize category and metric if not exist
-        if category not in self.metrics_history:
-            self.metrics_history[category] = {}
+        self._series(category, name).push(value, ts_ns)
         
-        if name not in self.metrics_history[category]:
-            self.metrics_history[category][name] = []
+        # Save metrics periodically (every 100 additions)
+        self._adds_since_save += 1
+        if self._adds_since_save >= 100:
+            self._adds_since_save = 0
+            self._request_save()
+    
+
+    def analyze(self, category: str, name: str, threshold: float = 3.0,
+                iqr_factor: float = 1.5, window_size: int = 10) -> Dict[str, Any]:
+        """
+        Run Z-score, IQR and trend detection in one fused pass.
         
-        # Add the new data point
-        self.metrics_history[category][name].append({
-            "value": value,
-            "timestamp": timestamp
-        })
+        One series lookup and one window view feed all three checks, instead
+        of three separate calls each re-reading the same data.
         
-        # Trim history if too large (keep last 1000 points)
-        if len(self.metrics_history[category][name]) > 1000:
-            self.metrics_history[category][name] = self.metrics_history[category][name][-1000:]
+        Args:
+            category: Metric category
+            name: Metric name
+            threshold: Z-score threshold
+            iqr_factor: IQR factor for outlier detection
+            window_size: Number of recent points for trend fitting
+            
+        Returns:
+            Dictionary with "zscore", "iqr" and "trend" sub-results, each
+            shaped like the corresponding detect_* return value
+        """
+        series = self.metrics_history.get((category, name))
+        if series is None:
+            return {
+                "status": "error",
+                "message": f"No history for metric {category}.{name}"
+            }
         
-        # Save metrics periodically (every 100 additions)
-        if sum(len(metrics) for cat in self.metrics_history.values() 
-               for metrics in cat.values()) % 100 == 0:
-            self._save_metrics_history()
-    
+        min_points = max(10, window_size)
+        if series.size < min_points:
+            return {
+                "status": "insufficient_data",
+                "message": f"Need at least {min_points} data points, have {series.size}"
+            }
+        
+        # Burst-triggered checks with no new samples get the memoized verdict
+        params = (threshold, iqr_factor, window_size)
+        if not series.dirty and series.last_result_key == params:
+            return series.last_result
+        
+        metric = f"{category}.{name}"
+        latest_value, latest_timestamp = series.latest()
+        
+        # Z-score from the O(1) running statistics
+        mean, std = series.mean_std()
+        z_score = abs((latest_value - mean) / std) if std > 0 else 0.0
+        is_anomaly = std > 0 and z_score > threshold
+        
+        zscore_result = {
+            "metric": metric,
+            "latest_value": latest_value,
+            "latest_timestamp": latest_timestamp,
+            "mean": float(mean),
+            "std": float(std),
+            "z_score": float(z_score),
+            "threshold": threshold,
+            "is_anomaly": is_anomaly
+        }
+        
+        # IQR bounds from the order-maintained window copy
+        q1 = series.quantile(0.25)
+        q3 = series.quantile(0.75)
+        iqr = q3 - q1
+        lower_bound = q1 - (iqr_factor * iqr)
+        upper_bound = q3 + (iqr_factor * iqr)
+        is_outlier = latest_value < lower_bound or latest_value > upper_bound
+        
+        iqr_result = {
+            "metric": metric,
+            "latest_value": latest_value,
+            "latest_timestamp": latest_timestamp,
+            "q1": float(q1),
+            "q3": float(q3),
+            "iqr": float(iqr),
+            "lower_bound": float(lower_bound),
+            "upper_bound": float(upper_bound),
+            "iqr_factor": iqr_factor,
+            "is_outlier": is_outlier
+        }
+        
+        # Trend over the recent window
+        trend_result = self.detect_trend(category, name, window_size)
+        
+        # Record detections exactly like the standalone methods do
+        if is_anomaly:
+            self._record_anomaly(category, name, zscore_result, {
+                "value": latest_value,
+                "timestamp": latest_timestamp,
+                "z_score": float(z_score),
+                "mean": float(mean),
+                "std": float(std)
+            })
+        if is_outlier:
+            self._record_anomaly(category, name, iqr_result, {
+                "value": latest_value,
+                "timestamp": latest_timestamp,
+                "type": "iqr_outlier",
+                "q1": float(q1),
+                "q3": float(q3),
+                "iqr": float(iqr),
+                "lower_bound": float(lower_bound),
+                "upper_bound": float(upper_bound)
+            })
+        
+        result = {
+            "metric": metric,
+            "zscore": zscore_result,
+            "iqr": iqr_result,
+            "trend": trend_result
+        }
+        series.dirty = False
+        series.last_result = result
+        series.last_result_key = params
+        return result
+
+    def _record_anomaly(self, category: str, name: str, result: Dict[str, Any],
+                        entry: Dict[str, Any]):
+        """Track a detected anomaly in memory and persist it to disk."""
+        bucket = self.anomalies_detected.setdefault(category, {}).setdefault(name, [])
+        bucket.append(entry)
+        try:
+            self._anom_fh.write(_json_dumps(result) + b"\n")
+            self._anom_writes += 1
+            if self._anom_writes % ANOMALY_FLUSH_EVERY == 0:
+                self._anom_fh.flush()
+                # Rotate once the log grows past the cap
+                if self._anom_fh.tell() > ANOMALY_LOG_MAX_BYTES:
+                    self._anom_fh.close()
+                    rotated = f"{ANOMALY_LOG_PATH}.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                    os.replace(ANOMALY_LOG_PATH, rotated)
+                    self._anom_fh = open(ANOMALY_LOG_PATH, "ab", buffering=1 << 16)
+        except Exception as e:
+            logger.error(f"Failed to save anomaly: {e}")
+
     def detect_anomalies_zscore(self, category: str, name: str, 
                                threshold: float = 3.0) -> Dict[str, Any]:
         """
@@ -99,25 +469,21 @@ class AnomalyDetector:
         Returns:
             Dictionary with anomaly detection results
         """
-        if category not in self.metrics_history or name not in self.metrics_history[category]:
+        series = self.metrics_history.get((category, name))
+        if series is None:
             return {
                 "status": "error",
                 "message": f"No history for metric {category}.{name}"
             }
         
-        # Get values from history
-        history = self.metrics_history[category][name]
-        if len(history) < 10:  # Need enough data points
+        if series.size < 10:  # Need enough data points
             return {
                 "status": "insufficient_data",
-                "message": f"Need at least 10 data points, have {len(history)}"
+                "message": f"Need at least 10 data points, have {series.size}"
             }
         
-        values = np.array([point["value"] for point in history])
-        
-        # Calculate statistics
-        mean = np.mean(values)
-        std = np.std(values)
+        # O(1) running statistics maintained by _Series.push
+        mean, std = series.mean_std()
         
         if std == 0:  # Avoid division by zero
             return {
@@ -126,8 +492,7 @@ class AnomalyDetector:
             }
         
         # Get the latest value
-        latest_value = values[-1]
-        latest_timestamp = history[-1]["timestamp"]
+        latest_value, latest_timestamp = series.latest()
         
         # Calculate Z-score
         z_score = abs((latest_value - mean) / std)
@@ -148,27 +513,13 @@ class AnomalyDetector:
         
         # Record anomaly if detected
         if is_anomaly:
-            if category not in self.anomalies_detected:
-                self.anomalies_detected[category] = {}
-            
-            if name not in self.anomalies_detected[category]:
-                self.anomalies_detected[category][name] = []
-            
-            self.anomalies_detected[category][name].append({
+            self._record_anomaly(category, name, result, {
                 "value": latest_value,
                 "timestamp": latest_timestamp,
                 "z_score": float(z_score),
                 "mean": float(mean),
                 "std": float(std)
             })
-            
-            # Save anomaly to disk
-            try:
-                anomaly_file = f"data/anomalies/{category}_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                with open(anomaly_file, "w") as f:
-                    json.dump(result, f)
-            except Exception as e:
-                logger.error(f"Failed to save anomaly: {e}")
         
         return result
     
@@ -185,25 +536,22 @@ class AnomalyDetector:
         Returns:
             Dictionary with outlier detection results
         """
-        if category not in self.metrics_history or name not in self.metrics_history[category]:
+        series = self.metrics_history.get((category, name))
+        if series is None:
             return {
                 "status": "error",
                 "message": f"No history for metric {category}.{name}"
             }
         
-        # Get values from history
-        history = self.metrics_history[category][name]
-        if len(history) < 10:  # Need enough data points
+        if series.size < 10:  # Need enough data points
             return {
                 "status": "insufficient_data",
-                "message": f"Need at least 10 data points, have {len(history)}"
+                "message": f"Need at least 10 data points, have {series.size}"
             }
         
-        values = np.array([point["value"] for point in history])
-        
-        # Calculate quartiles
-        q1 = np.percentile(values, 25)
-        q3 = np.percentile(values, 75)
+        # O(1) quartile lookups against the order-maintained window copy
+        q1 = series.quantile(0.25)
+        q3 = series.quantile(0.75)
         iqr = q3 - q1
         
         # Calculate bounds
@@ -211,8 +559,7 @@ class AnomalyDetector:
         upper_bound = q3 + (iqr_factor * iqr)
         
         # Get the latest value
-        latest_value = values[-1]
-        latest_timestamp = history[-1]["timestamp"]
+        latest_value, latest_timestamp = series.latest()
         
         # Check if outlier
         is_outlier = latest_value < lower_bound or latest_value > upper_bound
@@ -232,13 +579,7 @@ class AnomalyDetector:
         
         # Record anomaly if detected
         if is_outlier:
-            if category not in self.anomalies_detected:
-                self.anomalies_detected[category] = {}
-            
-            if name not in self.anomalies_detected[category]:
-                self.anomalies_detected[category][name] = []
-            
-            self.anomalies_detected[category][name].append({
+            self._record_anomaly(category, name, result, {
                 "value": latest_value,
                 "timestamp": latest_timestamp,
                 "type": "iqr_outlier",
@@ -248,14 +589,6 @@ class AnomalyDetector:
                 "lower_bound": float(lower_bound),
                 "upper_bound": float(upper_bound)
             })
-            
-            # Save anomaly to disk
-            try:
-                anomaly_file = f"data/anomalies/{category}_{name}_iqr_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                with open(anomaly_file, "w") as f:
-                    json.dump(result, f)
-            except Exception as e:
-                logger.error(f"Failed to save outlier: {e}")
         
         return result
     
@@ -272,39 +605,45 @@ class AnomalyDetector:
         Returns:
             Dictionary with trend detection results
         """
-        if category not in self.metrics_history or name not in self.metrics_history[category]:
+        series = self.metrics_history.get((category, name))
+        if series is None:
             return {
                 "status": "error",
                 "message": f"No history for metric {category}.{name}"
             }
         
-        # Get values from history
-        history = self.metrics_history[category][name]
-        if len(history) < window_size:
+        if series.size < window_size:
             return {
                 "status": "insufficient_data",
-                "message": f"Need at least {window_size} data points, have {len(history)}"
+                "message": f"Need at least {window_size} data points, have {series.size}"
             }
         
         # Get the recent window of values
-        recent_values = [point["value"] for point in history[-window_size:]]
-        
-        # Simple linear trend detection
-        x = np.arange(window_size)
-        y = np.array(recent_values)
-        
-        # Fit line to the data
-        try:
-            slope, intercept = np.polyfit(x, y, 1)
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": f"Error fitting trend line: {e}"
-            }
-        
-        # Calculate trend strength
-        y_pred = intercept + slope * x
-        r_squared = 1 - (np.sum((y - y_pred) ** 2) / np.sum((y - np.mean(y)) ** 2))
+        y = series.view()[-window_size:]
+        
+        # Closed-form degree-1 least squares: slope = cov(x, y) / var(x).
+        # x is arange(w), so its mean and variance have exact closed forms;
+        # this skips polyfit's Vandermonde build and LAPACK solve entirely.
+        if HAS_NUMBA:
+            # JIT-compiled fused sweep: no NumPy dispatch, SIMD-friendly
+            slope, intercept, r_squared = trend_kernel(np.ascontiguousarray(y))
+        else:
+            x = self._trend_x.get(window_size)
+            if x is None:
+                x = self._trend_x[window_size] = np.arange(window_size, dtype=np.float64)
+            x_mean = (window_size - 1) / 2.0
+            x_var = (window_size * window_size - 1) / 12.0
+            
+            y_mean = y.mean()
+            dy = y - y_mean
+            slope = np.einsum('i,i->', x - x_mean, dy) / (window_size * x_var)
+            intercept = y_mean - slope * x_mean
+            
+            # Calculate trend strength, reusing the centered residuals
+            resid = dy - slope * (x - x_mean)
+            ss_res = np.einsum('i,i->', resid, resid)
+            ss_tot = np.einsum('i,i->', dy, dy)
+            r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0.0
         
         # Determine trend direction
         if abs(slope) < 0.001 or r_squared < 0.5:
@@ -320,10 +659,26 @@ class AnomalyDetector:
             "slope": float(slope),
             "r_squared": float(r_squared),
             "window_size": window_size,
-            "recent_values": recent_values
+            "recent_values": y.tolist()
         }
 
 
+# Process-wide detector: metrics_history.json can be several MB, so parse it
+# once instead of on every scheduled check
+_detector: Optional[AnomalyDetector] = None
+_detector_lock = threading.Lock()
+
+
+def _get_detector(config) -> AnomalyDetector:
+    """Return the shared AnomalyDetector, creating it on first use."""
+    global _detector
+    if _detector is None:
+        with _detector_lock:
+            if _detector is None:
+                _detector = AnomalyDetector(config)
+    return _detector
+
+
 def check_system_anomalies(config, notifier=None) -> Dict[str, Any]:
     """
     Check for anomalies in system metrics.
@@ -337,7 +692,7 @@ def check_system_anomalies(config, notifier=None) -> Dict[str, Any]:
     """
     logger.info("Checking for system anomalies")
     
-    detector = AnomalyDetector(config)
+    detector = _get_detector(config)
     results = {
         "anomalies": [],
         "outliers": [],
@@ -358,33 +713,19 @@ def check_system_anomalies(config, notifier=None) -> Dict[str, Any]:
         detector.add_metric("memory_usage", memory_percent, "system")
         detector.add_metric("disk_usage", disk_percent, "system")
         
-        # Check for anomalies
-        cpu_anomaly = detector.detect_anomalies_zscore("system", "cpu_usage")
-        memory_anomaly = detector.detect_anomalies_zscore("system", "memory_usage")
-        disk_anomaly = detector.detect_anomalies_zscore("system", "disk_usage")
-        
-        # Check for outliers
-        cpu_outlier = detector.detect_outliers_iqr("system", "cpu_usage")
-        memory_outlier = detector.detect_outliers_iqr("system", "memory_usage")
-        disk_outlier = detector.detect_outliers_iqr("system", "disk_usage")
-        
-        # Check for trends
-        cpu_trend = detector.detect_trend("system", "cpu_usage")
-        memory_trend = detector.detect_trend("system", "memory_usage")
-        disk_trend = detector.detect_trend("system", "disk_usage")
-        
-        # Collect results
-        for result in [cpu_anomaly, memory_anomaly, disk_anomaly]:
-            if "is_anomaly" in result and result["is_anomaly"]:
-                results["anomalies"].append(result)
-        
-        for result in [cpu_outlier, memory_outlier, disk_outlier]:
-            if "is_outlier" in result and result["is_outlier"]:
-                results["outliers"].append(result)
-        
-        for result in [cpu_trend, memory_trend, disk_trend]:
-            if "trend" in result and result["trend"] != "stable":
-                results["trends"].append(result)
+        # One fused pass per metric covers Z-score, IQR and trend; the
+        # verdicts are then split into buckets with straight comprehensions
+        reports = [
+            report for report in (
+                detector.analyze("system", metric_name)
+                for metric_name in ("cpu_usage", "memory_usage", "disk_usage")
+            )
+            if "zscore" in report
+        ]
+        results["anomalies"] = [r["zscore"] for r in reports if r["zscore"]["is_anomaly"]]
+        results["outliers"] = [r["iqr"] for r in reports if r["iqr"]["is_outlier"]]
+        results["trends"] = [r["trend"] for r in reports
+                             if r["trend"].get("trend", "stable") != "stable"]
         
         # Send notifications if anomalies detected and notifier available
         if notifier and (results["anomalies"] or results["outliers"]):
@@ -431,7 +772,7 @@ def check_api_anomalies(config, notifier=None) -> Dict[str, Any]:
     """
     logger.info("Checking for API anomalies")
     
-    detector = AnomalyDetector(config)
+    detector = _get_detector(config)
     results = {
         "anomalies": [],
         "outliers": [],
@@ -447,40 +788,105 @@ def check_api_anomalies(config, notifier=None) -> Dict[str, Any]:
                 "message": "No API metrics data available"
             }
         
-        with open(api_metrics_file, "r") as f:
-            api_data = json.load(f)
-        
-        # Process each exchange
-        for exchange_name, exchange_data in api_data.get("exchanges", {}).items():
-            if "avg_response_time" in exchange_data:
-                # Add response time to metrics history
-                detector.add_metric(
-                    f"{exchange_name}_response_time",
-                    exchange_data["avg_response_time"],
-                    "api"
-                )
-                
-                # Check for anomalies in response time
-                anomaly_result = detector.detect_anomalies_zscore(
-                    "api", f"{exchange_name}_response_time"
-                )
-                
-                outlier_result = detector.detect_outliers_iqr(
-                    "api", f"{exchange_name}_response_time"
-                )
-                
-                trend_result = detector.detect_trend(
-                    "api", f"{exchange_name}_response_time"
-                )
-                
-                # Collect results
-                if "is_anomaly" in anomaly_result and anomaly_result["is_anomaly"]:
-                    results["anomalies"].append(anomaly_result)
-                
-                if "is_outlier" in outlier_result and outlier_result["is_outlier"]:
-                    results["outliers"].append(outlier_result)
-                
-                if "trend" in trend_result and trend_result["trend"] != "stable":
+        with open(api_metrics_file, "rb") as f:
+            raw = f.read()
+        api_data = _json_loads(raw)
+        
+        # Project just the fields we use before the detection loop
+        response_times = [
+            (exchange_name, exchange_data["avg_response_time"])
+            for exchange_name, exchange_data in api_data.get("exchanges", {}).items()
+            if "avg_response_time" in exchange_data
+        ]
+        
+        # Record all samples first, then detect across every exchange in one
+        # vectorized pass instead of dispatching small NumPy ops per exchange
+        metric_names = []
+        for exchange_name, avg_response_time in response_times:
+            name = f"{exchange_name}_response_time"
+            detector.add_metric(name, avg_response_time, "api")
+            metric_names.append(name)
+        
+        history = detector.metrics_history
+        eligible = [(name, history[("api", name)]) for name in metric_names
+                    if history[("api", name)].size >= 10]
+        
+        if eligible:
+            # Right-aligned NaN-padded (n_exchanges, window) stack so the
+            # last column is every series' latest sample
+            max_len = max(series.size for _, series in eligible)
+            stack = np.full((len(eligible), max_len), np.nan)
+            for i, (_, series) in enumerate(eligible):
+                stack[i, max_len - series.size:] = series.view()
+            
+            means = np.nanmean(stack, axis=1)
+            stds = np.nanstd(stack, axis=1)
+            q1s, q3s = np.nanpercentile(stack, [25, 75], axis=1)
+            iqrs = q3s - q1s
+            lower_bounds = q1s - 1.5 * iqrs
+            upper_bounds = q3s + 1.5 * iqrs
+            latest = stack[:, -1]
+            
+            z_scores = np.abs(latest - means) / np.where(stds > 0, stds, np.inf)
+            anomaly_mask = z_scores > 3.0
+            outlier_mask = (latest < lower_bounds) | (latest > upper_bounds)
+            
+            # Branchless bucket selection: flatnonzero picks the flagged
+            # rows directly instead of testing each row in Python
+            for i in np.flatnonzero(anomaly_mask):
+                name, series = eligible[i]
+                metric = f"api.{name}"
+                latest_value, latest_timestamp = series.latest()
+                zscore_result = {
+                    "metric": metric,
+                    "latest_value": latest_value,
+                    "latest_timestamp": latest_timestamp,
+                    "mean": float(means[i]),
+                    "std": float(stds[i]),
+                    "z_score": float(z_scores[i]),
+                    "threshold": 3.0,
+                    "is_anomaly": True
+                }
+                results["anomalies"].append(zscore_result)
+                detector._record_anomaly("api", name, zscore_result, {
+                    "value": latest_value,
+                    "timestamp": latest_timestamp,
+                    "z_score": float(z_scores[i]),
+                    "mean": float(means[i]),
+                    "std": float(stds[i])
+                })
+            
+            for i in np.flatnonzero(outlier_mask):
+                name, series = eligible[i]
+                metric = f"api.{name}"
+                latest_value, latest_timestamp = series.latest()
+                iqr_result = {
+                    "metric": metric,
+                    "latest_value": latest_value,
+                    "latest_timestamp": latest_timestamp,
+                    "q1": float(q1s[i]),
+                    "q3": float(q3s[i]),
+                    "iqr": float(iqrs[i]),
+                    "lower_bound": float(lower_bounds[i]),
+                    "upper_bound": float(upper_bounds[i]),
+                    "iqr_factor": 1.5,
+                    "is_outlier": True
+                }
+                results["outliers"].append(iqr_result)
+                detector._record_anomaly("api", name, iqr_result, {
+                    "value": latest_value,
+                    "timestamp": latest_timestamp,
+                    "type": "iqr_outlier",
+                    "q1": float(q1s[i]),
+                    "q3": float(q3s[i]),
+                    "iqr": float(iqrs[i]),
+                    "lower_bound": float(lower_bounds[i]),
+                    "upper_bound": float(upper_bounds[i])
+                })
+            
+            for name, _series in eligible:
+                trend_result = detector.detect_trend("api", name)
+                if trend_result.get("trend", "stable") != "stable":
                     results["trends"].append(trend_result)
         
         # Send notifications if anomalies detected and notifier available
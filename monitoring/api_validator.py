@@ -4,6 +4,8 @@ Provides comprehensive validation of API functionality and data integrity.
 """
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 import json
 import time
 from typing import Dict, List, Any, Optional, Callable
@@ -31,6 +33,30 @@ class APIValidator:
         self.service_name = service_name
         self.headers = {"Authorization": f"Bearer {api_key}"}
         
+        # One pooled session per validator: repeated probes against the same
+        # host reuse the TCP+TLS connection instead of paying DNS and the
+        # handshake on every call
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        
+        # Memoized (endpoint, method) -> (url, session method). The probe
+        # set is small and fixed, so after the first call the hot path skips
+        # the f-string, lstrip and upper/elif dispatch entirely
+        self._endpoint_cache: Dict[tuple, tuple] = {}
+    
+    def close(self):
+        """Release pooled connections."""
+        self._session.close()
+    
+    def __del__(self):
+        try:
+            self._session.close()
+        except Exception:
+            pass
+        
     def validate_endpoint(self, 
                          endpoint: str, 
                          method: str = "GET", 
@@ -52,23 +78,30 @@ class APIValidator:
         Returns:
             Dictionary with validation results
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        start_time = time.time()
-        
-        try:
-            if method.upper() == "GET":
-                response = requests.get(url, headers=self.headers, timeout=timeout)
-            elif method.upper() == "POST":
-                response = requests.post(url, headers=self.headers, json=payload, timeout=timeout)
-            elif method.upper() == "PUT":
-                response = requests.put(url, headers=self.headers, json=payload, timeout=timeout)
-            else:
+        cached = self._endpoint_cache.get((endpoint, method))
+        if cached is None:
+            url = f"{self.base_url}/{endpoint.lstrip('/')}"
+            request_fn = {
+                "GET": self._session.get,
+                "POST": self._session.post,
+                "PUT": self._session.put,
+            }.get(method.upper())
+            if request_fn is None:
                 return {
                     "status": "error",
                     "error": f"Unsupported HTTP method: {method}",
                     "endpoint": endpoint,
                     "service": self.service_name
                 }
+            cached = self._endpoint_cache[(endpoint, method)] = (url, request_fn)
+        url, request_fn = cached
+        start_time = time.time()
+        
+        try:
+            if payload is not None:
+                response = request_fn(url, json=payload, timeout=timeout)
+            else:
+                response = request_fn(url, timeout=timeout)
                 
             response_time = time.time() - start_time
             
@@ -138,6 +171,24 @@ class APIValidator:
                 "service": self.service_name
             }
     
+    def validate_concurrently(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run several validate_endpoint probes concurrently.
+        
+        The probes are independent and network-bound, so wall time drops
+        from the sum of the round-trips to the slowest one. Results come
+        back in the order the specs were given.
+        
+        Args:
+            specs: List of keyword-argument dicts for validate_endpoint
+            
+        Returns:
+            List of validation results, one per spec
+        """
+        with ThreadPoolExecutor(max_workers=len(specs)) as pool:
+            futures = [pool.submit(self.validate_endpoint, **spec) for spec in specs]
+            return [future.result() for future in futures]
+    
     def _get_data_sample(self, data: Any) -> Any:
         """
         Get a trimmed sample of response data for logging.
@@ -173,27 +224,18 @@ class XenorizeAPIValidator(APIValidator):
         Returns:
             List of validation results
         """
-        results = []
-        
-        # Basic health check
-        results.append(self.validate_endpoint("health"))
-        
-        # Validate bot status endpoint
-        results.append(self.validate_endpoint(
-            "bot/status",
-            validation_func=lambda data: "is_running" in data
-        ))
-        
-        # Add more specific validations for Xenorize API
-        # Example: validate user authentication
-        results.append(self.validate_endpoint(
-            "auth/verify",
-            method="POST",
-            payload={"token": self.api_key},
-            validation_func=lambda data: data.get("authenticated") is True
-        ))
-        
-        return results
+        return self.validate_concurrently([
+            # Basic health check
+            {"endpoint": "health"},
+            # Validate bot status endpoint
+            {"endpoint": "bot/status",
+             "validation_func": lambda data: "is_running" in data},
+            # Validate user authentication
+            {"endpoint": "auth/verify",
+             "method": "POST",
+             "payload": {"token": self.api_key},
+             "validation_func": lambda data: data.get("authenticated") is True},
+        ])
 
 
 class CryptellarAPIValidator(APIValidator):
@@ -206,25 +248,16 @@ class CryptellarAPIValidator(APIValidator):
         Returns:
             List of validation results
         """
-        results = []
-        
-        # Basic health check
-        results.append(self.validate_endpoint("health"))
-        
-        # Validate bot status endpoint
-        results.append(self.validate_endpoint(
-            "bot/status",
-            validation_func=lambda data: "is_running" in data
-        ))
-        
-        # Add more specific validations for Cryptellar API
-        # Example: validate market data endpoint
-        results.append(self.validate_endpoint(
-            "market/summary",
-            validation_func=lambda data: "timestamp" in data and "markets" in data
-        ))
-        
-        return results
+        return self.validate_concurrently([
+            # Basic health check
+            {"endpoint": "health"},
+            # Validate bot status endpoint
+            {"endpoint": "bot/status",
+             "validation_func": lambda data: "is_running" in data},
+            # Validate market data endpoint
+            {"endpoint": "market/summary",
+             "validation_func": lambda data: "timestamp" in data and "markets" in data},
+        ])
 
 
 def run_api_validations(config, notifier) -> None:
@@ -237,27 +270,30 @@ def run_api_validations(config, notifier) -> None:
     """
     logger.info("Running API validations")
     
-    all_results = []
+    validators = []
     
     # Validate Xenorize API if configured
     if config.xenorize_api_url and config.xenorize_api_key:
-        validator = XenorizeAPIValidator(
+        validators.append(XenorizeAPIValidator(
             config.xenorize_api_url,
             config.xenorize_api_key,
             "xenorize_api"
-        )
-        results = validator.validate_all()
-        all_results.extend(results)
+        ))
         
     # Validate Cryptellar API if configured
     if config.cryptellar_api_url and config.cryptellar_api_key:
-        validator = CryptellarAPIValidator(
+        validators.append(CryptellarAPIValidator(
             config.cryptellar_api_url,
             config.cryptellar_api_key,
             "cryptellar_api"
-        )
-        results = validator.validate_all()
-        all_results.extend(results)
+        ))
+    
+    # Both services are independent; overlap them as well
+    all_results = []
+    if validators:
+        with ThreadPoolExecutor(max_workers=len(validators)) as pool:
+            for results in pool.map(lambda v: v.validate_all(), validators):
+                all_results.extend(results)
     
     # Process results and send notifications for failures
     failures = [r for r in all_results if r["status"] != "ok"]
@@ -2,32 +2,268 @@
 Bot process monitoring module.
 Ensures that the bot processes for Xenorize and Cryptellar are running properly.
 """
+import atexit
 import logging
+import re
+from functools import lru_cache
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 import psutil
+import shlex
+import sqlite3
 import subprocess
 import os
+import sys
+import threading
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 logger = logging.getLogger("monitoring.bot_monitor")
 
-# Track previous restart attempts to avoid excessive restarts
-restart_attempts = {
-    "xenorize_bot": {
-        "count": 0,
-        "last_attempt": 0
-    },
-    "cryptellar_bot": {
-        "count": 0,
-        "last_attempt": 0
-    }
-}
+# Shared keep-alive session: the status probes hit the same two bot
+# endpoints every tick, so pooled connections skip the TCP and TLS
+# handshakes that a bare requests.get pays on every call
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+atexit.register(_SESSION.close)
+
+# When httpx is installed, probe over one HTTP/2 connection instead:
+# both bot APIs usually sit behind the same ingress, so concurrent
+# probes multiplex on a single stream rather than opening sockets
+try:
+    import httpx
+    _HTTPX = httpx.Client(
+        http2=True,
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        limits=httpx.Limits(max_keepalive_connections=8),
+    )
+    atexit.register(_HTTPX.close)
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout, httpx.TimeoutException)
+    _CONNECT_ERRORS = (requests.exceptions.ConnectionError, httpx.ConnectError)
+except ImportError:
+    httpx = None
+    _HTTPX = None
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+    _CONNECT_ERRORS = (requests.exceptions.ConnectionError,)
 
 # Maximum restart attempts in a 24-hour period
 MAX_RESTART_ATTEMPTS = 3
 # Cooldown period in seconds (24 hours)
 RESTART_COOLDOWN = 86400
+# Restart bookkeeping survives monitor restarts here
+RESTART_STATE_DB = "data/restart_state.db"
+
+# Wall clock anchored to the monotonic clock at import: an NTP step or
+# DST jump can neither bypass the restart cooldown nor extend it while
+# the monitor runs, yet stored values stay comparable across restarts
+_MONO_ANCHOR = time.time() - time.monotonic()
+
+
+def _steady_time() -> float:
+    """Wall-clock-valued timestamp driven by the monotonic clock."""
+    return _MONO_ANCHOR + time.monotonic()
+
+# Monitored bots as (service key, alert label); adding a bot here is all
+# the monitoring loop needs, provided config carries <service>_process
+BOTS = [
+    ("xenorize_bot", "XENORIZE"),
+    ("cryptellar_bot", "CRYPTELLAR"),
+]
+
+# Alert bodies built once at import; call sites just fill in the label
+# and issue list instead of re-interpolating multi-line f-strings
+_TEMPLATES = {
+    "down": ("\U0001F6A8 BOT DOWN: {label}\n\n"
+             "Issues:\n- {issues}\n\n"
+             "Attempting automatic restart..."),
+    "restart_ok": ("\u2705 RESTART SUCCESSFUL: {label}\n\n"
+                   "The bot has been restarted automatically."),
+    "restart_failed": ("\u274C RESTART FAILED: {label}\n\n"
+                       "Error: {error}\n\n"
+                       "Manual intervention required!"),
+}
+
+
+class _RestartLedger:
+    """
+    Persistent record of restart attempts per service.
+    
+    The in-memory counter this replaces was wiped whenever the monitor
+    itself restarted, which defeated the 24-hour cooldown: a crash loop
+    of the monitor re-armed the full restart budget every time. A tiny
+    SQLite file keeps the state across monitor restarts.
+    
+    Attempts are stored one row each and counted over a sliding
+    RESTART_COOLDOWN window, so old attempts age out continuously: a
+    bot that restarted three times yesterday isn't still blocked today.
+    """
+    
+    def __init__(self, path: str = RESTART_STATE_DB):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, isolation_level=None,
+                                     check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS restart_log ("
+            "service TEXT NOT NULL, "
+            "attempted_at REAL NOT NULL)")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_restart_log_service "
+            "ON restart_log (service, attempted_at)")
+    
+    def can_attempt(self, service: str) -> bool:
+        """Whether the service has restart budget left in the window."""
+        cutoff = _steady_time() - RESTART_COOLDOWN
+        with self._lock:
+            # Expired attempts no longer count; drop them while we're here
+            self._conn.execute(
+                "DELETE FROM restart_log WHERE attempted_at < ?", (cutoff,))
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM restart_log WHERE service = ?",
+                (service,)).fetchone()
+        return count < MAX_RESTART_ATTEMPTS
+    
+    def record(self, service: str):
+        """Record one restart attempt for the service."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute(
+                "INSERT INTO restart_log (service, attempted_at) VALUES (?, ?)",
+                (service, _steady_time()))
+            self._conn.execute("COMMIT")
+
+
+_ledger: Optional[_RestartLedger] = None
+_ledger_lock = threading.Lock()
+
+
+def _get_ledger() -> _RestartLedger:
+    """Open the shared restart ledger on first use."""
+    global _ledger
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                _ledger = _RestartLedger()
+    return _ledger
+
+
+def _read_proc_entry(pid: str) -> Tuple[bytes, bytes]:
+    """
+    Raw comm and cmdline bytes for one /proc entry.
+    
+    os.open/os.read skip the BufferedReader and TextIOWrapper that
+    Python's open() builds per file — a few allocations saved per PID,
+    thousands per sweep. Decoding is left to the caller, which only
+    needs it on the rare match.
+    """
+    fd = os.open(f"/proc/{pid}/comm", os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        comm = os.read(fd, 256)
+    finally:
+        os.close(fd)
+    fd = os.open(f"/proc/{pid}/cmdline", os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        cmdline = os.read(fd, 4096)
+    finally:
+        os.close(fd)
+    return comm, cmdline
+
+
+def _scan_proc_linux(needle_bytes: bytes) -> List[Dict[str, Any]]:
+    """
+    Find processes whose name or command line contains the given needle.
+    
+    Reads /proc/<pid>/comm and /proc/<pid>/cmdline directly instead of
+    going through psutil.process_iter, which pays per-process object
+    setup and PID-reuse checks we don't need for a substring match. On
+    hosts with thousands of PIDs this is an order of magnitude faster.
+    The needle arrives pre-encoded so the sweep never touches str.
+    """
+    matches = []
+    for entry in os.scandir('/proc'):
+        pid = entry.name
+        if not pid.isdigit():
+            continue
+        try:
+            comm_raw, cmd_raw = _read_proc_entry(pid)
+        except OSError:
+            # Process exited (or is inaccessible) mid-scan
+            continue
+        # Match on raw bytes; the non-matching 99% skip UTF-8 decode
+        if needle_bytes not in comm_raw and needle_bytes not in cmd_raw:
+            continue
+        name = comm_raw.decode(errors="replace").rstrip("\n")
+        cmdline = [arg for arg in cmd_raw.decode(errors="replace").split("\x00") if arg]
+        matches.append({"pid": int(pid), "name": name, "cmdline": cmdline})
+    return matches
+
+
+@lru_cache(maxsize=8)
+def _bot_pattern(names: Tuple[str, ...]):
+    """Compiled regex, group map and bytes needles for a fixed needle set."""
+    pattern = re.compile("|".join(
+        f"(?P<g{i}>{re.escape(name)})" for i, name in enumerate(names)))
+    group_to_name = {f"g{i}": name for i, name in enumerate(names)}
+    needle_bytes = tuple(name.encode("utf-8", "surrogateescape") for name in names)
+    return pattern, group_to_name, needle_bytes
+
+
+def scan_all_bots(names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Walk the process table once and bucket the matches per bot name.
+    
+    One alternation regex over all needles means a tick with several
+    monitored bots pays a single sweep (file opens and syscalls dominate
+    the cost) instead of one sweep per bot. Which alternative matched
+    tells us which bucket the process belongs to.
+    """
+    buckets: Dict[str, List[Dict[str, Any]]] = {name: [] for name in names}
+    if not names:
+        return buckets
+    
+    pattern, group_to_name, needle_bytes = _bot_pattern(tuple(names))
+    
+    if sys.platform.startswith("linux"):
+        for entry in os.scandir('/proc'):
+            pid = entry.name
+            if not pid.isdigit():
+                continue
+            try:
+                comm_raw, cmd_raw = _read_proc_entry(pid)
+            except OSError:
+                # Process exited (or is inaccessible) mid-scan
+                continue
+            # Cheap bytes prefilter before decoding and running the regex
+            raw = comm_raw + b" " + cmd_raw
+            if not any(nb in raw for nb in needle_bytes):
+                continue
+            proc_name = comm_raw.decode(errors="replace").rstrip("\n")
+            cmdline = [arg for arg in cmd_raw.decode(errors="replace").split("\x00") if arg]
+            match = pattern.search(proc_name) or pattern.search(" ".join(cmdline))
+            if match:
+                buckets[group_to_name[match.lastgroup]].append(
+                    {"pid": int(pid), "name": proc_name, "cmdline": cmdline})
+    else:
+        # Requesting cmdline in attrs would read it for every PID up
+        # front; filter on the cheap name first and fetch the command
+        # line only for the rare match
+        for proc in psutil.process_iter(['pid', 'name']):
+            try:
+                proc_name = proc.info['name'] or ''
+                match = pattern.search(proc_name)
+                if match:
+                    with proc.oneshot():
+                        buckets[group_to_name[match.lastgroup]].append({
+                            "pid": proc.info['pid'],
+                            "name": proc_name,
+                            "cmdline": proc.cmdline()
+                        })
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+    return buckets
 
 
 class BotProcessMonitor:
@@ -60,43 +296,74 @@ class BotProcessMonitor:
             self.process_name = config.cryptellar_bot_process
             self.start_command = config.cryptellar_bot_start_command
             self.start_directory = config.cryptellar_bot_directory
+        
+        # Pre-encoded needle for the bytes-level /proc sweep
+        self._needle_b = self.process_name.encode("utf-8", "surrogateescape")
+        
+        # Cached handle to the bot process found by the last scan; steady
+        # state only needs an is_running() stat instead of a table walk
+        self._cached_proc: Optional[psutil.Process] = None
+        self._cached_info: Optional[Dict[str, Any]] = None
     
-    def check_process_running(self) -> Dict[str, Any]:
+    def check_process_running(self, preloaded: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Check if the bot process is running.
         
+        Args:
+            preloaded: Matches for this bot from a shared scan_all_bots
+                sweep; when given, no further scan is performed
+        
         Returns:
             Dictionary with process status information
         """
         try:
-            running_processes = []
+            if preloaded is not None:
+                return self._build_process_result(preloaded)
             
-            # Search for processes by name
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+            # Fast path: the PID rarely changes between ticks, so poll the
+            # cached process and fall back to a full scan only when it died
+            if self._cached_proc is not None:
                 try:
-                    proc_info = proc.info
-                    # Check if the process name or command line contains the bot process name
-                    if (self.process_name in proc_info['name'] or 
-                        (proc_info['cmdline'] and any(self.process_name in cmd for cmd in proc_info['cmdline']))):
-                        running_processes.append(proc_info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    # oneshot caches the /proc/<pid>/stat read shared by
+                    # the liveness and status checks
+                    with self._cached_proc.oneshot():
+                        liveness = (self._cached_proc.is_running() and
+                                    self._cached_proc.status() != psutil.STATUS_ZOMBIE)
+                    if liveness:
+                        return {
+                            "status": "ok",
+                            "running": True,
+                            "process_count": 1,
+                            "processes": [self._cached_info],
+                            "service": self.service_name
+                        }
+                except (psutil.NoSuchProcess, psutil.ZombieProcess, psutil.AccessDenied):
                     pass
+                self._cached_proc = None
+                self._cached_info = None
             
-            if running_processes:
-                return {
-                    "status": "ok",
-                    "running": True,
-                    "process_count": len(running_processes),
-                    "processes": running_processes,
-                    "service": self.service_name
-                }
+            if sys.platform.startswith("linux"):
+                running_processes = _scan_proc_linux(self._needle_b)
             else:
-                return {
-                    "status": "error",
-                    "running": False,
-                    "error": f"Bot process '{self.process_name}' not found",
-                    "service": self.service_name
-                }
+                running_processes = []
+                
+                # Search for processes by name; the command line is only
+                # read for name matches, saving a per-PID fetch that
+                # almost always went unused
+                for proc in psutil.process_iter(['pid', 'name']):
+                    try:
+                        proc_name = proc.info['name'] or ''
+                        if self.process_name in proc_name:
+                            with proc.oneshot():
+                                running_processes.append({
+                                    "pid": proc.info['pid'],
+                                    "name": proc_name,
+                                    "cmdline": proc.cmdline()
+                                })
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        pass
+            
+            return self._build_process_result(running_processes)
         except Exception as e:
             return {
                 "status": "error",
@@ -105,6 +372,30 @@ class BotProcessMonitor:
                 "service": self.service_name
             }
     
+    def _build_process_result(self, running_processes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the status dict for a list of scan matches, updating the cache."""
+        if running_processes:
+            try:
+                self._cached_proc = psutil.Process(running_processes[0]["pid"])
+                self._cached_info = running_processes[0]
+            except psutil.NoSuchProcess:
+                self._cached_proc = None
+                self._cached_info = None
+            return {
+                "status": "ok",
+                "running": True,
+                "process_count": len(running_processes),
+                "processes": running_processes,
+                "service": self.service_name
+            }
+        else:
+            return {
+                "status": "error",
+                "running": False,
+                "error": f"Bot process '{self.process_name}' not found",
+                "service": self.service_name
+            }
+    
     def check_bot_api_status(self) -> Dict[str, Any]:
         """
         Check if the bot is responding via its API.
@@ -117,31 +408,56 @@ class BotProcessMonitor:
             url = f"{self.api_url}/bot/status"
             headers = {"Authorization": f"Bearer {self.api_key}"}
             
-            response = requests.get(url, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    "status": "ok" if data.get("is_running", False) else "error",
-                    "running": data.get("is_running", False),
-                    "details": data,
-                    "service": self.service_name
-                }
+            if _HTTPX is not None:
+                response = _HTTPX.get(url, headers=headers)
             else:
+                response = _SESSION.get(url, headers=headers, timeout=(3, 10))
+            
+            code = response.status_code
+            if 200 <= code < 300:
+                try:
+                    data = response.json()
+                except ValueError:
+                    data = None
+                
+                # A 2xx alone isn't proof of life: require the status
+                # payload signature so a cached or proxied page can't
+                # masquerade as a healthy bot
+                if isinstance(data, dict) and "is_running" in data:
+                    return {
+                        "status": "ok" if data.get("is_running", False) else "error",
+                        "running": data.get("is_running", False),
+                        "details": data,
+                        "service": self.service_name
+                    }
                 return {
                     "status": "error",
                     "running": False,
-                    "error": f"Bot API returned status code {response.status_code}",
+                    "error": f"Bot API returned {code} without a valid status payload",
                     "service": self.service_name
                 }
-        except requests.exceptions.Timeout:
+            
+            # Non-2xx: name the failure class so operators see the truth
+            if 300 <= code < 400:
+                error = f"Bot API redirected with status code {code}"
+            elif code >= 500:
+                error = f"Bot API upstream failure with status code {code}"
+            else:
+                error = f"Bot API returned status code {code}"
+            return {
+                "status": "error",
+                "running": False,
+                "error": error,
+                "service": self.service_name
+            }
+        except _TIMEOUT_ERRORS:
             return {
                 "status": "error", 
                 "running": False,
                 "error": "Request timed out", 
                 "service": self.service_name
             }
-        except requests.exceptions.ConnectionError:
+        except _CONNECT_ERRORS:
             return {
                 "status": "error", 
                 "running": False,
@@ -163,12 +479,10 @@ class BotProcessMonitor:
         Returns:
             Dictionary with restart attempt information
         """
-        global restart_attempts
+        ledger = _get_ledger()
         
         # Check if we've exceeded the maximum restart attempts
-        current_time = time.time()
-        if (restart_attempts[self.service_name]["count"] >= MAX_RESTART_ATTEMPTS and 
-            current_time - restart_attempts[self.service_name]["last_attempt"] < RESTART_COOLDOWN):
+        if not ledger.can_attempt(self.service_name):
             return {
                 "status": "error",
                 "error": f"Maximum restart attempts ({MAX_RESTART_ATTEMPTS}) exceeded in 24-hour period",
@@ -179,31 +493,54 @@ class BotProcessMonitor:
             logger.info(f"Attempting to restart {self.service_name}")
             
             # Update restart attempts counter
-            restart_attempts[self.service_name]["count"] += 1
-            restart_attempts[self.service_name]["last_attempt"] = current_time
+            ledger.record(self.service_name)
+            
+            # Launch the start command detached in its own session so the
+            # bot survives the monitor and we skip the /bin/sh fork that
+            # shell=True paid. Output goes to an append-only log rather
+            # than pipes: a bot that outlives the grace period would
+            # block as soon as a pipe buffer filled with nobody left to
+            # drain it
+            log_path = f"data/{self.service_name}_restart.log"
+            with open(log_path, "ab") as log_fh:
+                start_pos = log_fh.tell()
+                proc = subprocess.Popen(
+                    shlex.split(self.start_command),
+                    cwd=self.start_directory,
+                    start_new_session=True,
+                    stdout=log_fh,
+                    stderr=subprocess.STDOUT
+                )
+            
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                # Still running after the grace period: the bot came up as
+                # a long-running process rather than a forking starter
+                return {
+                    "status": "ok",
+                    "message": f"Successfully restarted {self.service_name} (still running)",
+                    "output": "",
+                    "service": self.service_name
+                }
             
-            # Execute the restart command
-            result = subprocess.run(
-                self.start_command,
-                shell=True,
-                cwd=self.start_directory,
-                capture_output=True,
-                text=True
-            )
+            # Quick exit either way: report what this attempt logged
+            with open(log_path, "rb") as log_fh:
+                log_fh.seek(start_pos)
+                output = log_fh.read().decode("utf-8", "replace")
             
-            if result.returncode == 0:
+            if proc.returncode == 0:
                 return {
                     "status": "ok",
                     "message": f"Successfully restarted {self.service_name}",
-                    "output": result.stdout,
+                    "output": output,
                     "service": self.service_name
                 }
             else:
                 return {
                     "status": "error",
                     "error": f"Failed to restart {self.service_name}",
-                    "stderr": result.stderr,
-                    "stdout": result.stdout,
+                    "output": output,
                     "service": self.service_name
                 }
         except Exception as e:
@@ -214,106 +551,108 @@ class BotProcessMonitor:
             }
 
 
-def run_bot_monitoring(config, notifier) -> None:
+# Monitors persist across scheduler ticks so their cached PIDs (and any
+# other per-bot state) survive between runs of run_bot_monitoring
+_monitors: Dict[str, BotProcessMonitor] = {}
+
+
+def _monitor_bot(monitor: BotProcessMonitor, label: str, notifier,
+                 api_status: Dict[str, Any],
+                 preloaded: Optional[List[Dict[str, Any]]] = None) -> None:
     """
-    Check the status of bot processes and attempt to restart them if necessary.
+    Evaluate one bot's API result plus process state, alerting and
+    restarting if it is down.
     
     Args:
-        config: Application configuration
+        monitor: The bot's process monitor
+        label: Upper-case display name used in alerts
         notifier: Notification service
+        api_status: Result of the already-run check_bot_api_status probe
+        preloaded: This bot's matches from the shared process sweep
     """
-    logger.info("Running bot process checks")
+    process_status = monitor.check_process_running(preloaded)
+    
+    process_running = process_status.get("running", False)
+    api_running = api_status.get("running", False)
     
-    # Check Xenorize bot if configured
-    if hasattr(config, 'xenorize_bot_process') and config.xenorize_bot_process:
-        monitor = BotProcessMonitor("xenorize_bot", config)
+    # Alert if either the process or API is down
+    if not process_running or not api_running:
+        issue_description = []
         
-        # Check if process is running
-        process_status = monitor.check_process_running()
-        api_status = monitor.check_bot_api_status()
+        if not process_running:
+            issue_description.append(f"Process not running: {process_status.get('error', 'Unknown error')}")
         
-        process_running = process_status.get("running", False)
-        api_running = api_status.get("running", False)
+        if not api_running:
+            issue_description.append(f"API not responding: {api_status.get('error', 'Unknown error')}")
         
-        # Alert if either the process or API is down
-        if not process_running or not api_running:
-            issue_description = []
-            
-            if not process_running:
-                issue_description.append(f"Process not running: {process_status.get('error', 'Unknown error')}")
-            
-            if not api_running:
-                issue_description.append(f"API not responding: {api_status.get('error', 'Unknown error')}")
-            
-            logger.warning(f"Xenorize bot issues detected: {', '.join(issue_description)}")
-            
-            # Send notification
-            notifier.send_alert(
-                f"🚨 BOT DOWN: XENORIZE\n\n"
-                f"Issues:\n- {'\n- '.join(issue_description)}\n\n"
-                f"Attempting automatic restart..."
-            )
-            
-            # Attempt restart
-            restart_result = monitor.attempt_restart()
-            
-            if restart_result["status"] == "ok":
-                notifier.send_alert(
-                    f"✅ RESTART SUCCESSFUL: XENORIZE\n\n"
-                    f"The bot has been restarted automatically."
-                )
-                logger.info("Xenorize bot restarted successfully")
-            else:
-                notifier.send_alert(
-                    f"❌ RESTART FAILED: XENORIZE\n\n"
-                    f"Error: {restart_result.get('error', 'Unknown error')}\n\n"
-                    f"Manual intervention required!"
-                )
-                logger.error(f"Failed to restart Xenorize bot: {restart_result.get('error', 'Unknown error')}")
-    
-    # Check Cryptellar bot if configured
-    if hasattr(config, 'cryptellar_bot_process') and config.cryptellar_bot_process:
-        monitor = BotProcessMonitor("cryptellar_bot", config)
+        logger.warning(f"{label.capitalize()} bot issues detected: {', '.join(issue_description)}")
         
-        # Check if process is running
-        process_status = monitor.check_process_running()
-        api_status = monitor.check_bot_api_status()
+        # Send notification
+        notifier.send_alert(_TEMPLATES["down"].format(
+            label=label, issues="\n- ".join(issue_description)))
         
-        process_running = process_status.get("running", False)
-        api_running = api_status.get("running", False)
+        # Attempt restart
+        restart_result = monitor.attempt_restart()
         
-        # Alert if either the process or API is down
-        if not process_running or not api_running:
-            issue_description = []
-            
-            if not process_running:
-                issue_description.append(f"Process not running: {process_status.get('error', 'Unknown error')}")
-            
-            if not api_running:
-                issue_description.append(f"API not responding: {api_status.get('error', 'Unknown error')}")
-            
-            logger.warning(f"Cryptellar bot issues detected: {', '.join(issue_description)}")
-            
-            # Send notification
-            notifier.send_alert(
-                f"🚨 BOT DOWN: CRYPTELLAR\n\n"
-                f"Issues:\n- {'\n- '.join(issue_description)}\n\n"
-                f"Attempting automatic restart..."
-            )
-            
-            # Attempt restart
-            restart_result = monitor.attempt_restart()
-            
-            if restart_result["status"] == "ok":
-                notifier.send_alert(
-                    f"✅ RESTART SUCCESSFUL: CRYPTELLAR\n\n"
-                    f"The bot has been restarted automatically."
-                )
-                logger.info("Cryptellar bot restarted successfully")
-            else:
-                notifier.send_alert(
-                    f"❌ RESTART FAILED: CRYPTELLAR\n\n"
-                    f"Error: {restart_result.get('error', 'Unknown error')}\n\n"
-                    f"Manual intervention required!"
-                )
-                logger.error(f"Failed to restart Cryptellar bot: {restart_result.get('error', 'Unknown error')}")
+        if restart_result["status"] == "ok":
+            notifier.send_alert(_TEMPLATES["restart_ok"].format(label=label))
+            logger.info(f"{label.capitalize()} bot restarted successfully")
+        else:
+            error = restart_result.get('error', 'Unknown error')
+            notifier.send_alert(_TEMPLATES["restart_failed"].format(
+                label=label, error=error))
+            logger.error(f"Failed to restart {label.capitalize()} bot: {error}")
+
+
+def run_bot_monitoring(config, notifier) -> None:
+    """
+    Check the status of bot processes and attempt to restart them if necessary.
+    
+    Args:
+        config: Application configuration
+        notifier: Notification service
+    """
+    logger.info("Running bot process checks")
+    
+    targets = [
+        (service_name, label, getattr(config, f"{service_name}_process", None))
+        for service_name, label in BOTS
+    ]
+    targets = [target for target in targets if target[2]]
+    
+    if not targets:
+        return
+    
+    monitors = []
+    for service_name, label, process_name in targets:
+        monitor = _monitors.get(service_name)
+        if monitor is None:
+            monitor = _monitors[service_name] = BotProcessMonitor(service_name, config)
+        monitors.append((monitor, label, process_name))
+    
+    # API probes first, concurrently: each can block for seconds, so wall
+    # time tracks the slowest, not the sum
+    with ThreadPoolExecutor(max_workers=len(monitors)) as pool:
+        api_statuses = list(pool.map(
+            lambda entry: entry[0].check_bot_api_status(), monitors))
+    
+    # A live API answer implies the process is up, so the healthy steady
+    # state skips the process sweep entirely; strict_process_check forces
+    # the old always-scan behaviour
+    strict = bool(getattr(config, "strict_process_check", False))
+    pending = [(monitor, label, process_name, api_status)
+               for (monitor, label, process_name), api_status in zip(monitors, api_statuses)
+               if strict or not api_status.get("running", False)]
+    
+    if not pending:
+        return
+    
+    # One shared sweep of the process table covers every bot that needs it
+    buckets = scan_all_bots([process_name for _, _, process_name, _ in pending])
+    
+    with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+        futures = [pool.submit(_monitor_bot, monitor, label, notifier,
+                               api_status, buckets[process_name])
+                   for monitor, label, process_name, api_status in pending]
+        for future in futures:
+            future.result()
@@ -3,6 +3,7 @@ Performance monitoring module for system resource usage.
 Tracks CPU, memory, and disk usage to ensure optimal performance.
 """
 import logging
+import time
 import psutil
 import platform
 from datetime import datetime
@@ -19,13 +20,27 @@ previous_measurements = {
 }
 
 
+# Co-scheduled jobs (performance check, anomaly detection, daily report) all
+# sample the same counters within seconds of each other; share one sample for
+# this long rather than paying the 1s cpu_percent interval per caller.
+METRICS_CACHE_TTL = 5  # seconds
+
+_metrics_cache = {"at": 0.0, "metrics": None}
+
+
 def get_system_metrics() -> Dict[str, Any]:
     """
     Collect system performance metrics including CPU, memory, and disk usage.
+    Results are cached for METRICS_CACHE_TTL seconds, so callers may see a
+    sample up to that many seconds old.
     
     Returns:
         Dictionary with system metrics
     """
+    now = time.monotonic()
+    if _metrics_cache["metrics"] is not None and now - _metrics_cache["at"] < METRICS_CACHE_TTL:
+        return _metrics_cache["metrics"]
+    
     cpu_percent = psutil.cpu_percent(interval=1)
     memory = psutil.virtual_memory()
     disk = psutil.disk_usage('/')
@@ -63,6 +78,9 @@ def get_system_metrics() -> Dict[str, Any]:
         "timestamp": metrics["timestamp"]
     }
     
+    _metrics_cache["at"] = time.monotonic()
+    _metrics_cache["metrics"] = metrics
+    
     return metrics
 
 
@@ -11,15 +11,29 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
 import threading
 
+# msgspec decodes JSON several times faster than the stdlib; use it for the
+# bulk startup load when the wheel is installed, stdlib json otherwise.
+try:
+    import msgspec.json
+    _decode_json = msgspec.json.decode
+except ImportError:
+    _decode_json = json.loads
+
 from api.connection_models import (
-    encrypt_value, decrypt_value,
-    ExchangeConnectionInDB, ExchangeConnectionBase, ExchangeConnectionResponse,
-    BotConnectionInDB, BotConnectionBase, BotConnectionResponse,
-    ServerConnectionInDB, ServerConnectionBase, ServerConnectionResponse,
+    encrypt_value, decrypt_value, encrypt_fields, decrypt_fields,
+    ExchangeConnectionInDB, ExchangeConnectionBase,
+    BotConnectionInDB, BotConnectionBase,
+    ServerConnectionInDB, ServerConnectionBase,
 )
 
 logger = logging.getLogger("utils.connection_manager")
 
+# Updatable field names per stored model, computed once at import so updates
+# use a set-membership check instead of per-key hasattr lookups
+_EXCHANGE_FIELDS = frozenset(ExchangeConnectionInDB.model_fields)
+_BOT_FIELDS = frozenset(BotConnectionInDB.model_fields)
+_SERVER_FIELDS = frozenset(ServerConnectionInDB.model_fields)
+
 class ConnectionManager:
     """
     Manager for connection settings.
@@ -50,6 +64,10 @@ class ConnectionManager:
         self.bots: Dict[str, BotConnectionInDB] = {}
         self.servers: Dict[str, ServerConnectionInDB] = {}
         
+        # Monotonic per-resource write versions; the API layer uses these to
+        # build ETags so unchanged list polls can short-circuit with a 304
+        self._versions = {"exchanges": 0, "bots": 0, "servers": 0}
+        
         # Load existing connections
         self._load_all_connections()
     
@@ -73,15 +91,29 @@ class ConnectionManager:
                     continue
                 
                 filepath = os.path.join(directory, filename)
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
+                with open(filepath, 'rb') as f:
+                    data = _decode_json(f.read())
                 
-                # Decrypt sensitive fields
-                for field in model_class._encrypted_fields:
-                    if field in data and data[field]:
-                        data[field] = decrypt_value(data[field])
+                # Decrypt sensitive fields: new files pack them into one
+                # blob; older files store each field encrypted individually
+                blob = data.pop("_secrets", None)
+                if blob:
+                    data.update(decrypt_fields(blob))
+                    # A blob that fails authentication (corrupt file,
+                    # lost or rotated key) decrypts to {}; fill the
+                    # expected fields with the baseline placeholder so
+                    # the record still constructs and GET/list/test/PUT
+                    # keep working instead of 500ing on missing attrs
+                    for field in model_class._encrypted_fields:
+                        data.setdefault(field, "[DECRYPTION_ERROR]")
+                else:
+                    for field in model_class._encrypted_fields:
+                        if field in data and data[field]:
+                            data[field] = decrypt_value(data[field])
                 
-                connection = model_class(**data)
+                # Stored rows already passed full validation at write time,
+                # so skip re-running validators on this trusted read path
+                connection = model_class.model_construct(**data)
                 collection[connection.id] = connection
         except Exception as e:
             logger.error(f"Error loading {connection_type} connections: {e}")
@@ -94,12 +126,15 @@ class ConnectionManager:
             filepath = os.path.join(directory, filename)
             
             # Convert to dict
-            data = connection.dict()
+            data = connection.model_dump()
             
-            # Encrypt sensitive fields
-            for field in model_class._encrypted_fields:
-                if field in data and data[field]:
-                    data[field] = encrypt_value(data[field])
+            # Pack the sensitive fields into one ciphertext so a write pays
+            # the Fernet framing cost once instead of once per field
+            secrets = {field: data.pop(field)
+                       for field in model_class._encrypted_fields
+                       if data.get(field)}
+            if secrets:
+                data["_secrets"] = encrypt_fields(secrets)
             
             with open(filepath, 'w') as f:
                 json.dump(data, f, indent=2)
@@ -110,6 +145,14 @@ class ConnectionManager:
             logger.error(f"Error saving {connection_type} connection: {e}")
             raise
     
+    def get_version(self, connection_type: str) -> int:
+        """Get the current write version for a connection type."""
+        return self._versions[connection_type]
+    
+    def _bump_version(self, connection_type: str):
+        """Record a write to a connection type."""
+        self._versions[connection_type] += 1
+    
     def _delete_connection(self, connection_type: str, connection_id: str) -> bool:
         """Delete a connection from storage."""
         directory = os.path.join(self.storage_path, connection_type)
@@ -134,10 +177,11 @@ class ConnectionManager:
             
             exchange_connection = ExchangeConnectionInDB(
                 id=connection_id,
-                **connection.dict()
+                **connection.model_dump()
             )
             
             self.exchanges[connection_id] = exchange_connection
+            self._bump_version("exchanges")
             self._save_connection("exchanges", exchange_connection, ExchangeConnectionInDB)
             
             return exchange_connection
@@ -146,12 +190,14 @@ class ConnectionManager:
         """Get an exchange connection by ID."""
         return self.exchanges.get(connection_id)
     
-    def get_all_exchange_connections(self) -> List[ExchangeConnectionResponse]:
+    def iter_exchange_connections(self):
+        """Iterate exchange connections without building the full response list."""
+        # Snapshot the values so concurrent writes don't break iteration
+        yield from list(self.exchanges.values())
+    
+    def get_all_exchange_connections(self) -> List[ExchangeConnectionInDB]:
         """Get all exchange connections."""
-        return [
-            ExchangeConnectionResponse(**conn.dict())
-            for conn in self.exchanges.values()
-        ]
+        return list(self.exchanges.values())
     
     def update_exchange_connection(self, connection_id: str, updates: Dict[str, Any]) -> Optional[ExchangeConnectionInDB]:
         """Update an exchange connection."""
@@ -163,10 +209,13 @@ class ConnectionManager:
             
             # Update fields
             for key, value in updates.items():
-                if hasattr(connection, key) and value is not None:
+                if key in _EXCHANGE_FIELDS and value is not None:
                     setattr(connection, key, value)
             
+            self._bump_version("exchanges")
             self._save_connection("exchanges", connection, ExchangeConnectionInDB)
+            # Updated secrets re-encrypt to new ciphertexts; drop stale plaintexts
+            decrypt_value.cache_clear()
             
             return connection
     
@@ -177,6 +226,7 @@ class ConnectionManager:
                 return False
             
             del self.exchanges[connection_id]
+            self._bump_version("exchanges")
             return self._delete_connection("exchanges", connection_id)
     
     # Bot connection methods
@@ -187,10 +237,11 @@ class ConnectionManager:
             
             bot_connection = BotConnectionInDB(
                 id=connection_id,
-                **connection.dict()
+                **connection.model_dump()
             )
             
             self.bots[connection_id] = bot_connection
+            self._bump_version("bots")
             self._save_connection("bots", bot_connection, BotConnectionInDB)
             
             return bot_connection
@@ -199,12 +250,14 @@ class ConnectionManager:
         """Get a bot connection by ID."""
         return self.bots.get(connection_id)
     
-    def get_all_bot_connections(self) -> List[BotConnectionResponse]:
+    def iter_bot_connections(self):
+        """Iterate bot connections without building the full response list."""
+        # Snapshot the values so concurrent writes don't break iteration
+        yield from list(self.bots.values())
+    
+    def get_all_bot_connections(self) -> List[BotConnectionInDB]:
         """Get all bot connections."""
-        return [
-            BotConnectionResponse(**conn.dict())
-            for conn in self.bots.values()
-        ]
+        return list(self.bots.values())
     
     def update_bot_connection(self, connection_id: str, updates: Dict[str, Any]) -> Optional[BotConnectionInDB]:
         """Update a bot connection."""
@@ -216,10 +269,13 @@ class ConnectionManager:
             
             # Update fields
             for key, value in updates.items():
-                if hasattr(connection, key) and value is not None:
+                if key in _BOT_FIELDS and value is not None:
                     setattr(connection, key, value)
             
+            self._bump_version("bots")
             self._save_connection("bots", connection, BotConnectionInDB)
+            # Updated secrets re-encrypt to new ciphertexts; drop stale plaintexts
+            decrypt_value.cache_clear()
             
             return connection
     
@@ -230,6 +286,7 @@ class ConnectionManager:
                 return False
             
             del self.bots[connection_id]
+            self._bump_version("bots")
             return self._delete_connection("bots", connection_id)
     
     # Server connection methods
@@ -240,10 +297,11 @@ class ConnectionManager:
             
             server_connection = ServerConnectionInDB(
                 id=connection_id,
-                **connection.dict()
+                **connection.model_dump()
             )
             
             self.servers[connection_id] = server_connection
+            self._bump_version("servers")
             self._save_connection("servers", server_connection, ServerConnectionInDB)
             
             return server_connection
@@ -252,12 +310,14 @@ class ConnectionManager:
         """Get a server connection by ID."""
         return self.servers.get(connection_id)
     
-    def get_all_server_connections(self) -> List[ServerConnectionResponse]:
+    def iter_server_connections(self):
+        """Iterate server connections without building the full response list."""
+        # Snapshot the values so concurrent writes don't break iteration
+        yield from list(self.servers.values())
+    
+    def get_all_server_connections(self) -> List[ServerConnectionInDB]:
         """Get all server connections."""
-        return [
-            ServerConnectionResponse(**conn.dict())
-            for conn in self.servers.values()
-        ]
+        return list(self.servers.values())
     
     def update_server_connection(self, connection_id: str, updates: Dict[str, Any]) -> Optional[ServerConnectionInDB]:
         """Update a server connection."""
@@ -269,10 +329,13 @@ class ConnectionManager:
             
             # Update fields
             for key, value in updates.items():
-                if hasattr(connection, key) and value is not None:
+                if key in _SERVER_FIELDS and value is not None:
                     setattr(connection, key, value)
             
+            self._bump_version("servers")
             self._save_connection("servers", connection, ServerConnectionInDB)
+            # Updated secrets re-encrypt to new ciphertexts; drop stale plaintexts
+            decrypt_value.cache_clear()
             
             return connection
     
@@ -283,4 +346,5 @@ class ConnectionManager:
                 return False
             
             del self.servers[connection_id]
+            self._bump_version("servers")
             return self._delete_connection("servers", connection_id)
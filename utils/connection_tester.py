@@ -5,6 +5,7 @@ Provides functionality for testing connections to exchanges, bots, and servers.
 import logging
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional, Tuple
 import socket
 import paramiko
@@ -27,6 +28,23 @@ class ConnectionTester:
             timeout: Default timeout for connection attempts in seconds
         """
         self.timeout = timeout
+        
+        # One pooled session for all HTTP probes; keep-alive amortizes the
+        # TCP/TLS handshake across repeated tests of the same host
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+    
+    def close(self):
+        """Release pooled HTTP connections."""
+        self._session.close()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
     
     def test_exchange_connection(self, 
                                exchange_name: str, 
@@ -140,7 +158,7 @@ class ConnectionTester:
             
             # Make the request
             start_time = time.time()
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            response = self._session.get(url, headers=headers, timeout=self.timeout)
             response_time = time.time() - start_time
             
             # Check response
@@ -255,7 +273,7 @@ class ConnectionTester:
             
             # Make the request
             start_time = time.time()
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            response = self._session.get(url, headers=headers, timeout=self.timeout)
             response_time = time.time() - start_time
             
             # Check response